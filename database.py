@@ -16,6 +16,13 @@ logger = logging.getLogger(__name__)
 client: Optional[AsyncIOMotorClient] = None
 database: Optional[AsyncIOMotorDatabase] = None
 
+# Connection pool settings (overridable per deployment). The bulk endpoints fan
+# out more than single-item calls, so the defaults leave headroom for them.
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000"))
+
 
 async def connect_to_mongodb() -> AsyncIOMotorDatabase:
     """
@@ -44,11 +51,16 @@ async def connect_to_mongodb() -> AsyncIOMotorDatabase:
     db_name = db_name.rstrip(';')
 
     try:
-        # Create MongoDB client with connection pooling
+        # Create MongoDB client with connection pooling.
+        # One client is shared by every request (see get_db), so the pool is
+        # sized for burst concurrency; idle connections are kept warm and
+        # callers fail fast instead of queueing forever when it is exhausted.
         client = AsyncIOMotorClient(
             connection_string,
-            maxPoolSize=50,
-            minPoolSize=10,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS,
             serverSelectionTimeoutMS=5000,
             connectTimeoutMS=10000,
             socketTimeoutMS=10000,
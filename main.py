@@ -6,7 +6,8 @@ File: main.py
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 from datetime import datetime
@@ -17,6 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database import connect_to_mongodb, disconnect_from_mongodb
+from repositories.value_set_repository import ValueSetRepository
 from routers.value_set_router import router as value_set_router
 
 # Configure logging
@@ -43,9 +45,17 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up Value Set Management System...")
     try:
         # Connect to MongoDB
-        await connect_to_mongodb()
+        database = await connect_to_mongodb()
         logger.info("Successfully connected to MongoDB")
 
+        # Ensure query indexes exist (a failure here should not block startup,
+        # but a missing unique key index needs the one-off migration)
+        try:
+            index_names = await ValueSetRepository(database).ensure_indexes()
+            logger.info(f"Ensured value set indexes: {index_names}")
+        except Exception as e:
+            logger.error(f"Could not ensure value set indexes: {e}")
+
         # Log startup information
         logger.info(f"Application started at {datetime.utcnow().isoformat()}")
         logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'development')}")
@@ -72,6 +82,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -84,6 +95,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (CSV/JSON exports, listings) for clients that accept gzip.
+# Level 1 is several times faster than the default and still shrinks the
+# repetitive row structure well; streamed exports are compressed chunk by chunk.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", 1024)),
+    compresslevel=int(os.getenv("GZIP_COMPRESS_LEVEL", 1)),
+)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -49,6 +49,92 @@ class ValueSetRepository:
         self.db = database
         self.collection: AsyncIOMotorCollection = database.value_sets
 
+    async def ensure_indexes(self) -> List[str]:
+        """
+        Create the indexes that back the repository's query patterns.
+
+        LLM Instructions:
+        • Call this once at application startup after connecting to MongoDB
+        • Safe to call repeatedly; existing identical indexes are left untouched
+        • Add an index here whenever a new query pattern is introduced
+
+        Business Logic:
+        • 'key_unique': enforces one value set per key, so a create that races
+          another past the service's existence check fails with DuplicateKeyError;
+          also serves every key lookup (find_by_key, update_by_key, item operations,
+          check_key_exists, archive/restore)
+        • An existing unique index on key (e.g. 'key_1' created by hand) is reused
+        • An existing non-unique index on key is never dropped here; it keeps serving
+          key lookups and a RuntimeError asks for the one-off key index migration
+          (see repositories/README.md)
+        • 'key_unique' is built in its own create_index call after the list indexes;
+          if the build fails (duplicate keys in the collection) a RuntimeError is
+          raised and the list indexes are already in place
+        • 'status_1_module_1_createdAt_-1__id_-1': list_value_sets and
+          list_value_sets_summary filtered by status and module, sorted newest first (createdAt, then _id)
+        • 'status_1_createdAt_-1__id_-1': the same list queries filtered by status only
+        • 'module_1_createdAt_-1__id_-1': the same list queries filtered by module only
+        • 'createdAt_-1__id_-1': unfiltered list queries sorted newest first (createdAt, then _id)
+
+        Returns:
+            List[str]: Names of the indexes that were ensured.
+
+        Raises:
+            RuntimeError: If the unique key index is missing and cannot be built
+                without the one-off key index migration.
+
+        Example:
+        ```python
+        repository = ValueSetRepository(database)
+        names = await repository.ensure_indexes()
+        print(f"Ensured indexes: {names}")
+        ```
+        """
+        names = await self.collection.create_indexes([
+            pymongo.IndexModel(
+                [
+                    ("status", pymongo.ASCENDING),
+                    ("module", pymongo.ASCENDING),
+                    ("createdAt", pymongo.DESCENDING),
+                    ("_id", pymongo.DESCENDING)
+                ],
+                name="status_1_module_1_createdAt_-1__id_-1"
+            ),
+            pymongo.IndexModel(
+                [("status", pymongo.ASCENDING), ("createdAt", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+                name="status_1_createdAt_-1__id_-1"
+            ),
+            pymongo.IndexModel(
+                [("module", pymongo.ASCENDING), ("createdAt", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+                name="module_1_createdAt_-1__id_-1"
+            ),
+            pymongo.IndexModel(
+                [("createdAt", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+                name="createdAt_-1__id_-1"
+            ),
+        ])
+
+        # Reuse an existing unique index on key; never drop a non-unique one here
+        existing = await self.collection.index_information()
+        key_index = next((name for name, info in existing.items() if info["key"] == [("key", 1)]), None)
+        if key_index and not existing[key_index].get("unique"):
+            raise RuntimeError(
+                f"Index '{key_index}' on key is not unique; left in place. "
+                "Run the one-off key index migration to enable 'key_unique'"
+            )
+        if key_index is None:
+            try:
+                key_index = await self.collection.create_index(
+                    [("key", pymongo.ASCENDING)], unique=True, name="key_unique"
+                )
+            except pymongo.errors.OperationFailure as e:
+                raise RuntimeError(
+                    "Could not build 'key_unique' (duplicate keys?). "
+                    "Run the one-off key index migration to dedupe keys"
+                ) from e
+
+        return [key_index] + names
+
     async def create(self, value_set_data: dict) -> dict:
         """
         Create a new value set document in the MongoDB collection.
@@ -139,6 +225,39 @@ class ValueSetRepository:
             document["_id"] = str(document["_id"])
         return document
 
+    async def find_by_keys(self, keys: List[str]) -> Dict[str, dict]:
+        """
+        Retrieve several value set documents by key in a single query.
+
+        LLM Instructions:
+        • Use this instead of calling find_by_key in a loop
+        • Use this when batching lookups for many keys at once
+        • Check for missing keys with dict.get(); absent keys are simply omitted
+
+        Business Logic:
+        • Issues one find with {'key': {'$in': keys}}
+        • Converts MongoDB ObjectId to string for JSON compatibility
+        • Keeps the first document returned per key, like find_by_key
+        • Keys that match no document are not present in the result
+
+        Args:
+            keys (List[str]): Value set keys to look up. Duplicates are allowed.
+
+        Returns:
+            Dict[str, dict]: Mapping of key to its complete value set document.
+
+        Example:
+        ```python
+        documents = await repository.find_by_keys(['COUNTRY_CODES', 'USER_ROLES'])
+        country_codes = documents.get('COUNTRY_CODES')
+        ```
+        """
+        documents = {}
+        async for document in self.collection.find({"key": {"$in": keys}}):
+            document["_id"] = str(document["_id"])
+            documents.setdefault(document["key"], document)
+        return documents
+
     async def find_by_id(self, value_set_id: str) -> Optional[dict]:
         """
         Retrieve a value set document using its MongoDB ObjectId.
@@ -302,6 +421,111 @@ class ValueSetRepository:
 
         return documents, total
 
+    async def list_value_sets_summary(
+        self,
+        filter_query: dict,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: List[tuple] = None,
+        include_total: bool = True,
+        after: Optional[tuple] = None
+    ) -> tuple[List[dict], Optional[int], bool]:
+        """
+        Retrieve paginated value set summaries with the item count computed in MongoDB.
+
+        LLM Instructions:
+        • Use this for list views that only need an item count, not the items
+        • Prefer this over list_value_sets when rendering summaries
+        • Use list_value_sets when callers need the full items arrays
+
+        Business Logic:
+        • Runs an aggregation pipeline: $match → $sort → $skip → $limit
+        • Computes 'itemCount' server-side with $size (missing items count as 0)
+        • Projects away the 'items' array so it never crosses the wire
+        • Fetches one document beyond the page to determine hasMore without counting
+        • Runs count_documents only when include_total is True
+        • Defaults to sorting by creation date, then _id (newest first)
+        • With 'after', resumes strictly after that (createdAt, _id) position
+          (keyset pagination), so deep pages cost the same as the first one
+        • Documents with a missing or null createdAt sort last and are still
+          reached by the cursor; their position is (None, _id)
+
+        Args:
+            filter_query (dict): MongoDB query document for filtering.
+                Examples: {}, {'status': 'active'}, {'module': 'core'}.
+            skip (int, optional): Number of documents to skip. Defaults to 0.
+            limit (int, optional): Maximum number of documents to return. Defaults to 100.
+            sort_by (List[tuple], optional): MongoDB sort specification.
+                Format: [('field', direction)].
+                Defaults to [('createdAt', pymongo.DESCENDING), ('_id', pymongo.DESCENDING)].
+            include_total (bool, optional): Whether to count all matching documents.
+                Defaults to True. Pass False to save the count round-trip.
+            after (Optional[tuple], optional): (createdAt, ObjectId) of the last
+                document of the previous page, with createdAt None when that
+                document has none. Only valid with the default sort.
+                The total count still covers the whole filter, not just later pages.
+
+        Returns:
+            tuple[List[dict], Optional[int], bool]: Tuple containing:
+                - List of value set documents without 'items', with 'itemCount'
+                  and '_id' as string
+                - Total count of documents matching the filter, or None when
+                  include_total is False
+                - Whether more documents exist after this page
+
+        Example:
+        ```python
+        summaries, total, has_more = await repository.list_value_sets_summary(
+            {'status': 'active'}, skip=0, limit=20
+        )
+
+        for summary in summaries:
+            print(f"{summary['key']}: {summary['itemCount']} items")
+        ```
+        """
+        if sort_by is None:
+            sort_by = [("createdAt", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]
+
+        # Get total count only when the caller needs it
+        total = None
+        if include_total:
+            total = await self.collection.count_documents(filter_query)
+
+        # Resume after the last seen (createdAt, _id) for keyset pagination
+        match_query = filter_query
+        if after is not None:
+            created_at, last_id = after
+            if created_at is None:
+                # Missing/null createdAt sorts below every date, so only those remain
+                match_query = {**filter_query, "createdAt": None, "_id": {"$lt": last_id}}
+            else:
+                match_query = {
+                    **filter_query,
+                    "$or": [
+                        {"createdAt": {"$lt": created_at}},
+                        {"createdAt": created_at, "_id": {"$lt": last_id}},
+                        {"createdAt": None}
+                    ]
+                }
+
+        # Request one extra document to learn whether another page exists
+        pipeline = [
+            {"$match": match_query},
+            {"$sort": dict(sort_by)},
+            {"$skip": skip},
+            {"$limit": limit + 1},
+            {"$addFields": {"itemCount": {"$size": {"$ifNull": ["$items", []]}}}},
+            {"$project": {"items": 0}}
+        ]
+
+        documents = []
+        async for doc in self.collection.aggregate(pipeline):
+            doc["_id"] = str(doc["_id"])
+            documents.append(doc)
+
+        has_more = len(documents) > limit
+        return documents[:limit], total, has_more
+
     async def search_items(
         self,
         search_query: str,
@@ -320,8 +544,8 @@ class ValueSetRepository:
         • Uses MongoDB aggregation pipeline for complex item filtering
         • Searches both item codes and language-specific labels
         • Case-insensitive regex matching for flexible search
-        • Returns value sets containing only the matching items
-        • Groups results by value set to maintain document structure
+        • Skips value sets without a matching item via $elemMatch before projecting
+        • Returns value sets containing only the matching items ($filter, no $unwind)
 
         Args:
             search_query (str): Text to search for in item codes and labels.
@@ -353,36 +577,51 @@ class ValueSetRepository:
                 print(f"  {item['code']}: {item['labels']['en']}")
         ```
         """
-        # Build search pipeline
-        pipeline = []
+        search_field = f"labels.{language_code}"
+        regex = {"$regex": search_query, "$options": "i"}
 
-        # Filter by value set key if provided
-        if value_set_key:
-            pipeline.append({"$match": {"key": value_set_key}})
-
-        # Unwind items array
-        pipeline.append({"$unwind": "$items"})
-
-        # Search in items
-        search_field = f"items.labels.{language_code}"
-        pipeline.extend([
-            {
-                "$match": {
+        # Only value sets with at least one matching item enter the pipeline
+        match_query = {
+            "items": {
+                "$elemMatch": {
                     "$or": [
-                        {"items.code": {"$regex": search_query, "$options": "i"}},
-                        {search_field: {"$regex": search_query, "$options": "i"}}
+                        {"code": regex},
+                        {search_field: regex}
                     ]
                 }
-            },
+            }
+        }
+
+        # Filter by value set key if provided
+        if value_set_key:
+            match_query["key"] = value_set_key
+
+        # Keep only the matching items in place instead of unwinding and regrouping
+        pipeline = [
+            {"$match": match_query},
             {
-                "$group": {
-                    "_id": "$_id",
-                    "key": {"$first": "$key"},
-                    "module": {"$first": "$module"},
-                    "matchingItems": {"$push": "$items"}
+                "$project": {
+                    "key": 1,
+                    "module": 1,
+                    "matchingItems": {
+                        "$filter": {
+                            "input": "$items",
+                            "as": "item",
+                            "cond": {
+                                "$or": [
+                                    {"$regexMatch": {"input": "$$item.code", "regex": search_query, "options": "i"}},
+                                    {"$regexMatch": {
+                                        "input": {"$ifNull": [f"$$item.{search_field}", ""]},
+                                        "regex": search_query,
+                                        "options": "i"
+                                    }}
+                                ]
+                            }
+                        }
+                    }
                 }
             }
-        ])
+        ]
 
         results = []
         async for doc in self.collection.aggregate(pipeline):
@@ -524,6 +763,60 @@ class ValueSetRepository:
             result["_id"] = str(result["_id"])
         return result
 
+    async def add_items(self, key: str, new_items: List[dict], update_fields: dict) -> Optional[dict]:
+        """
+        Append several items to a value set's items array and return the updated document.
+
+        LLM Instructions:
+        • Use this when several single-item additions to one value set are coalesced
+        • The new codes must be distinct from each other; the caller checks that
+        • A None result is ambiguous: read the codes to tell the cases apart
+        • Use bulk_add_items when the updated document is not needed
+
+        Business Logic:
+        • Uses MongoDB $push with $each so all items land in one atomic update
+        • The filter only matches when none of the new codes are already present
+          and the array has room for every new item (500 max)
+        • Preserves the order of new_items at the end of the array
+        • Returns the complete updated document including all items
+
+        Args:
+            key (str): Unique value set key to identify the target document.
+            new_items (List[dict]): Item objects to append, each with 'code' and 'labels'.
+            update_fields (dict): Document fields to $set alongside the push,
+                typically 'updatedAt' and 'updatedBy'.
+
+        Returns:
+            Optional[dict]: Complete updated value set document with the new items,
+                or None if the value set key doesn't exist, a code is taken or the
+                items would not fit.
+
+        Example:
+        ```python
+        result = await repository.add_items(
+            'PRIORITY_LEVELS',
+            [{'code': 'LOW', 'labels': {'en': 'Low'}}, {'code': 'MID', 'labels': {'en': 'Medium'}}],
+            {'updatedAt': datetime.utcnow(), 'updatedBy': 'admin_user'}
+        )
+        ```
+        """
+        # Index 500 - n must be free for n more items to stay within the limit
+        result = await self.collection.find_one_and_update(
+            {
+                "key": key,
+                "items.code": {"$nin": [item["code"] for item in new_items]},
+                f"items.{500 - len(new_items)}": {"$exists": False}
+            },
+            {
+                "$push": {"items": {"$each": new_items}},
+                "$set": update_fields
+            },
+            return_document=ReturnDocument.AFTER
+        )
+        if result:
+            result["_id"] = str(result["_id"])
+        return result
+
     async def update_item(
         self,
         key: str,
@@ -540,11 +833,13 @@ class ValueSetRepository:
         • Use this when you need to update metadata alongside item changes
 
         Business Logic:
-        • Uses MongoDB positional operator ($) to update the matched item
+        • Uses a filtered positional operator ($[elem]) to update the matched item
         • Requires exact match on both value set key and item code
+        • When item_updates changes 'code', the new code must not already exist
         • Updates only the specified item fields, preserves others
         • Also updates document-level metadata fields
-        • Returns None if value set or item not found
+        • With no item fields to set, only the metadata fields are updated
+        • Returns None if value set or item not found, or if the new code conflicts
 
         Args:
             key (str): Value set key to identify the document.
@@ -561,7 +856,7 @@ class ValueSetRepository:
 
         Returns:
             Optional[dict]: Complete updated value set document,
-                or None if value set key or item code not found.
+                or None if value set key or item code not found or the new code conflicts.
 
         Example:
         ```python
@@ -584,20 +879,45 @@ class ValueSetRepository:
             print(f"Updated label: {updated_item['labels']['en']}")
         ```
         """
-        # Build update query for nested item
-        set_query = update_fields.copy()
-        for field, value in item_updates.items():
-            set_query[f"items.$.{field}"] = value
-
+        filter_query, update = self._item_update_query(key, item_code, item_updates, update_fields)
         result = await self.collection.find_one_and_update(
-            {"key": key, "items.code": item_code},
-            {"$set": set_query},
+            filter_query,
+            update,
+            array_filters=self._item_array_filters(item_code, item_updates),
             return_document=ReturnDocument.AFTER
         )
         if result:
             result["_id"] = str(result["_id"])
         return result
 
+    @staticmethod
+    def _item_update_query(
+        key: str,
+        item_code: str,
+        item_updates: dict,
+        update_fields: dict
+    ) -> tuple[dict, dict]:
+        """Build the filter and $set update for one item, targeted through $[elem]."""
+        # Build update query for nested item
+        set_query = update_fields.copy()
+        for field, value in item_updates.items():
+            set_query[f"items.$[elem].{field}"] = value
+
+        # Require the target item, and refuse a code change onto another item's code
+        filter_query = {"key": key, "items.code": item_code}
+        new_code = item_updates.get("code")
+        if new_code and new_code != item_code:
+            filter_query = {"key": key, "$and": [{"items.code": item_code}, {"items.code": {"$ne": new_code}}]}
+
+        return filter_query, {"$set": set_query}
+
+    @staticmethod
+    def _item_array_filters(item_code: str, item_updates: dict) -> Optional[List[dict]]:
+        """The $[elem] filter, or None when no item field is set (MongoDB rejects unused identifiers)."""
+        if not item_updates:
+            return None
+        return [{"elem.code": item_code}]
+
 
     async def bulk_add_items(
         self,
@@ -690,11 +1010,19 @@ class ValueSetRepository:
         • Use this when you need detailed error reporting for each operation
 
         Business Logic:
-        • Processes operations sequentially, not as MongoDB bulk operation
+        • Loads the item codes of every targeted value set in one query
+        • Checks each operation against those codes in order (item must exist,
+          a new code must not collide), applying accepted code changes as it goes
+        • Sends all accepted operations in a single bulk_write
+        • Uses ordered=False unless several operations touch the same value set,
+          where order matters
         • Continues processing even if individual operations fail
         • Tracks successful and failed operations separately
-        • Provides detailed error information for debugging
-        • Uses the update_item method internally for each operation
+        • Reports an error for every failed operation, including operations an
+          ordered write never reached and items removed before the write landed
+        • When concurrent writes make it impossible to tell which operations
+          matched nothing, every operation that may have failed is reported by
+          key and item_code as "Outcome unknown"; no error entry is anonymous
 
         Args:
             operations (List[Dict[str, Any]]): List of update operations.
@@ -740,117 +1068,110 @@ class ValueSetRepository:
         ```
         """
         results = {"successful": 0, "failed": 0, "errors": []}
+        if not operations:
+            return results
+
+        # Current codes of every targeted value set, fetched in one round-trip
+        keys = list({op["key"] for op in operations})
+        codes_by_key = {}
+        async for document in self.collection.find({"key": {"$in": keys}}, {"key": 1, "items.code": 1}):
+            codes_by_key.setdefault(document["key"], {item["code"] for item in document.get("items", [])})
 
+        bulk_ops = []
+        sent_ops = []
         for op in operations:
-            try:
-                result = await self.update_item(
-                    op["key"],
-                    op["item_code"],
-                    op["updates"],
-                    op["update_fields"]
+            codes = codes_by_key.get(op["key"])
+            new_code = op["updates"].get("code")
+
+            if codes is None or op["item_code"] not in codes:
+                error = "Item not found"
+            elif new_code and new_code != op["item_code"] and new_code in codes:
+                error = f"Item with code '{new_code}' already exists"
+            else:
+                filter_query, update = self._item_update_query(
+                    op["key"], op["item_code"], op["updates"], op["update_fields"]
                 )
-                if result:
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-                    results["errors"].append({
-                        "key": op["key"],
-                        "item_code": op["item_code"],
-                        "error": "Item not found"
-                    })
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append({
-                    "key": op["key"],
-                    "item_code": op["item_code"],
-                    "error": str(e)
-                })
-
-        return results
-
+                bulk_ops.append(pymongo.UpdateOne(
+                    filter_query,
+                    update,
+                    array_filters=self._item_array_filters(op["item_code"], op["updates"])
+                ))
+                sent_ops.append(op)
+                if new_code:
+                    codes.discard(op["item_code"])
+                    codes.add(new_code)
+                continue
+
+            results["failed"] += 1
+            results["errors"].append(self._item_op_error(op, error))
 
-    async def replace_item_value(
-        self,
-        key: str,
-        old_code: str,
-        new_item: dict,
-        update_fields: dict
-    ) -> Optional[dict]:
-        """
-        Replace an entire item in a value set with completely new data.
-
-        LLM Instructions:
-        • Use this when changing an item's code or completely restructuring it
-        • Call this for item migrations or major item changes
-        • Use update_item for partial updates, this for complete replacement
-
-        Business Logic:
-        • Performs two sequential operations: remove old item, add new item
-        • Uses MongoDB $pull to remove item by code, then $push for new item
-        • Updates document metadata only after successful replacement
-        • Returns None if the value set doesn't exist
-        • May result in item position change within the array
-
-        Args:
-            key (str): Value set key to identify the target document.
-            old_code (str): Code of the existing item to remove.
-                Must match exactly. If not found, operation continues to add new item.
-            new_item (dict): Complete new item object to add.
-                Should include all required fields like 'code', 'labels', etc.
-                The new code can be the same as old_code or completely different.
-            update_fields (dict): Document-level metadata fields to update.
-                Applied only after successful item replacement.
-
-        Returns:
-            Optional[dict]: Complete updated value set document with replaced item,
-                or None if the value set key doesn't exist.
+        if bulk_ops:
+            # Keep server-side order only when operations on one value set may depend on each other
+            ordered = len(keys) < len(operations)
+            attempted = sent_ops
+            try:
+                result = await self.collection.bulk_write(bulk_ops, ordered=ordered)
+                matched = result.matched_count
+            except pymongo.errors.BulkWriteError as e:
+                matched = e.details.get("nMatched", 0)
+                write_errors = e.details.get("writeErrors", [])
+                for write_error in write_errors:
+                    op = sent_ops[write_error["index"]]
+                    results["errors"].append(self._item_op_error(op, write_error.get("errmsg", "Write error")))
+
+                failed_indexes = {write_error["index"] for write_error in write_errors}
+                if ordered and write_errors:
+                    # An ordered write stops at its first error; nothing after it ran
+                    stop = write_errors[0]["index"]
+                    for op in sent_ops[stop + 1:]:
+                        results["errors"].append(
+                            self._item_op_error(op, "Not applied: an earlier operation in the batch failed")
+                        )
+                    attempted = sent_ops[:stop]
+                else:
+                    attempted = [op for idx, op in enumerate(sent_ops) if idx not in failed_indexes]
 
-        Example:
-        ```python
-        # Replace item with new code and structure
-        old_code = 'TEMP_CODE'
-        new_item = {
-            'code': 'PERMANENT_CODE',
-            'labels': {'en': 'Permanent Status', 'es': 'Estado Permanente'},
-            'priority': 1,
-            'active': True
-        }
+            results["successful"] += matched
+            results["failed"] += len(bulk_ops) - matched
 
-        update_fields = {
-            'updatedAt': datetime.utcnow(),
-            'updatedBy': 'migration_script'
-        }
+            # Operations that ran but matched nothing lost their item to a concurrent write
+            unmatched = len(attempted) - matched
+            if unmatched > 0:
+                results["errors"].extend(await self._unmatched_item_errors(attempted, unmatched))
 
-        result = await repository.replace_item_value(
-            'STATUS_CODES', old_code, new_item, update_fields
-        )
+        return results
 
-        if result:
-            codes = [item['code'] for item in result['items']]
-            print(f"Updated codes: {codes}")
-        ```
-        """
-        # First remove old item, then add new one
-        result = await self.collection.find_one_and_update(
-            {"key": key},
-            {
-                "$pull": {"items": {"code": old_code}}
-            }
+    @staticmethod
+    def _item_op_error(op: Dict[str, Any], error: str) -> dict:
+        """The error entry bulk_update_items reports for one operation."""
+        return {"key": op["key"], "item_code": op["item_code"], "error": error}
+
+    async def _unmatched_item_errors(self, attempted: List[Dict[str, Any]], unmatched: int) -> List[dict]:
+        """Name the operations a bulk write matched nothing for; bulk_write only reports a count."""
+        error = "Item not found at write time"
+        current_codes = {}
+        query = {"key": {"$in": list({op["key"] for op in attempted})}}
+        async for document in self.collection.find(query, {"key": 1, "items.code": 1}):
+            current_codes[document["key"]] = {item["code"] for item in document.get("items", [])}
+
+        # An applied operation leaves its resulting code behind
+        missing, present = [], []
+        for op in attempted:
+            code = op["updates"].get("code") or op["item_code"]
+            (present if code in current_codes.get(op["key"], ()) else missing).append(op)
+
+        if len(missing) == unmatched:
+            return [self._item_op_error(op, error) for op in missing]
+
+        # Later writes hid which operations missed; name every one that may have
+        unknown = "Outcome unknown: the value set changed concurrently"
+        if len(missing) > unmatched:
+            return [self._item_op_error(op, unknown) for op in missing]
+        return (
+            [self._item_op_error(op, error) for op in missing]
+            + [self._item_op_error(op, unknown) for op in present]
         )
 
-        if result:
-            result = await self.collection.find_one_and_update(
-                {"key": key},
-                {
-                    "$push": {"items": new_item},
-                    "$set": update_fields
-                },
-                return_document=ReturnDocument.AFTER
-            )
-            if result:
-                result["_id"] = str(result["_id"])
-
-        return result
 
     async def bulk_create(self, value_sets: List[dict]) -> Dict[str, Any]:
         """
@@ -864,6 +1185,7 @@ class ValueSetRepository:
         Business Logic:
         • Uses MongoDB insert_many with unordered operations
         • Continues inserting even if some documents fail (duplicate keys, etc.)
+        • Reports keys rejected by the unique key index as "Key '...' already exists"
         • Handles BulkWriteError gracefully with detailed error reporting
         • Returns both successful insertions and failure details
         • Does not validate document structure before insertion
@@ -885,7 +1207,9 @@ class ValueSetRepository:
                 - 'successful' (int): Number of documents successfully created
                 - 'failed' (int): Number of failed insertions
                 - 'inserted_ids' (List[str]): ObjectIds of created documents (success case)
-                - 'errors' (List[dict]): Detailed error information (failure case)
+                - 'inserted_keys' (List[str]): Keys of the documents that were created
+                - 'errors' (List[dict]): Per-document failures with 'index', 'key' and
+                  'error' (failure case)
 
         Example:
         ```python
@@ -919,15 +1243,32 @@ class ValueSetRepository:
             return {
                 "successful": len(result.inserted_ids),
                 "failed": 0,
-                "inserted_ids": [str(id) for id in result.inserted_ids]
+                "inserted_ids": [str(id) for id in result.inserted_ids],
+                "inserted_keys": [doc["key"] for doc in value_sets]
             }
         except pymongo.errors.BulkWriteError as e:
             successful = e.details.get('nInserted', 0)
-            errors = e.details.get('writeErrors', [])
+            write_errors = e.details.get('writeErrors', [])
+            # Unordered inserts attempt every document, so only the reported indexes failed
+            failed_indexes = {error["index"] for error in write_errors}
             return {
                 "successful": successful,
-                "failed": len(errors),
-                "errors": errors
+                "failed": len(write_errors),
+                "inserted_keys": [
+                    doc["key"] for idx, doc in enumerate(value_sets) if idx not in failed_indexes
+                ],
+                "errors": [
+                    {
+                        "index": error["index"],
+                        "key": value_sets[error["index"]]["key"],
+                        # 11000: the unique key index rejected a key inserted since it was checked
+                        "error": (
+                            f"Key '{value_sets[error['index']]['key']}' already exists"
+                            if error.get("code") == 11000 else error.get("errmsg", "Write error")
+                        )
+                    }
+                    for error in write_errors
+                ]
             }
 
     async def bulk_update(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -940,11 +1281,14 @@ class ValueSetRepository:
         • Use this for better performance than individual update_by_key calls
 
         Business Logic:
-        • Uses MongoDB bulk_write with UpdateOne operations
+        • Resolves which keys exist with one find_keys_in query first
+        • Uses MongoDB bulk_write with UpdateOne operations for existing keys only
         • All operations use $set to update specified fields only
         • Operations are unordered for better performance
-        • Returns summary statistics of successful operations
-        • Does not provide detailed error information per operation
+        • Counts come from the bulk_write result; if fewer operations matched than
+          were sent, the keys are looked up again to find the ones removed meanwhile
+        • Returns summary statistics plus the keys that were actually updated
+          and those that were not found, each listed once
 
         Args:
             operations (List[Dict[str, Any]]): List of update operations.
@@ -963,7 +1307,9 @@ class ValueSetRepository:
         Returns:
             Dict[str, Any]: Operation summary with keys:
                 - 'modified' (int): Number of documents successfully updated
-                - 'matched' (int): Number of documents that matched the queries
+                - 'matched' (int): Number of operations that matched a document
+                - 'modified_keys' (List[str]): Distinct keys of the updated value sets
+                - 'missing_keys' (List[str]): Distinct keys that match no value set
 
         Example:
         ```python
@@ -990,8 +1336,20 @@ class ValueSetRepository:
         print(f"Updated {result['modified']} of {result['matched']} matched documents")
         ```
         """
+        if not operations:
+            return {"modified": 0, "matched": 0, "modified_keys": [], "missing_keys": []}
+
+        # Find which keys exist so each operation's outcome is known
+        existing_keys = set(await self.find_keys_in([op["key"] for op in operations]))
+
         bulk_ops = []
+        sent_keys = []
+        missing_keys = []
         for op in operations:
+            if op["key"] not in existing_keys:
+                missing_keys.append(op["key"])
+                continue
+            sent_keys.append(op["key"])
             bulk_ops.append(
                 pymongo.UpdateOne(
                     {"key": op["key"]},
@@ -999,13 +1357,24 @@ class ValueSetRepository:
                 )
             )
 
+        matched = modified = 0
         if bulk_ops:
             result = await self.collection.bulk_write(bulk_ops, ordered=False)
-            return {
-                "modified": result.modified_count,
-                "matched": result.matched_count
-            }
-        return {"modified": 0, "matched": 0}
+            matched = result.matched_count
+            modified = result.modified_count
+
+            # Some value sets disappeared after the existence check; find out which
+            if matched < len(bulk_ops):
+                still_existing = set(await self.find_keys_in(sent_keys))
+                missing_keys.extend(key for key in sent_keys if key not in still_existing)
+                sent_keys = [key for key in sent_keys if key in still_existing]
+
+        return {
+            "modified": modified,
+            "matched": matched,
+            "modified_keys": list(dict.fromkeys(sent_keys)),
+            "missing_keys": list(dict.fromkeys(missing_keys))
+        }
 
     async def archive(self, key: str, update_fields: dict) -> Optional[dict]:
         """
@@ -1103,6 +1472,79 @@ class ValueSetRepository:
         update_fields["status"] = "active"
         return await self.update_by_key(key, update_fields)
 
+    async def archive_if_active(self, key: str, update_fields: dict) -> Optional[dict]:
+        """
+        Archive a value set in one round-trip unless it is already archived.
+
+        LLM Instructions:
+        • Use this instead of find_by_key followed by archive
+        • A None result means the key is missing or the set is already archived;
+          call find_by_key only then, to tell the two apart
+
+        Business Logic:
+        • Filters on status != 'archived', so the check and the write are atomic
+        • Sets status to 'archived' together with update_fields
+        • Returns the document as it was before the update
+
+        Args:
+            key (str): Unique value set key to identify the document to archive.
+            update_fields (dict): Additional fields to set, typically 'updatedAt' and 'updatedBy'.
+
+        Returns:
+            Optional[dict]: The pre-update document (its 'status' is the previous status),
+                or None if nothing was archived.
+
+        Example:
+        ```python
+        previous = await repository.archive_if_active('OLD_CODES', {'updatedBy': 'admin'})
+        if previous:
+            print(f"Archived; was {previous['status']}")
+        ```
+        """
+        return await self._set_status_unless(key, "archived", update_fields)
+
+    async def restore_if_archived(self, key: str, update_fields: dict) -> Optional[dict]:
+        """
+        Restore a value set in one round-trip unless it is already active.
+
+        LLM Instructions:
+        • Use this instead of find_by_key followed by restore
+        • A None result means the key is missing or the set is already active;
+          call find_by_key only then, to tell the two apart
+
+        Business Logic:
+        • Filters on status != 'active', so the check and the write are atomic
+        • Sets status to 'active' together with update_fields
+        • Returns the document as it was before the update
+
+        Args:
+            key (str): Unique value set key to identify the document to restore.
+            update_fields (dict): Additional fields to set, typically 'updatedAt' and 'updatedBy'.
+
+        Returns:
+            Optional[dict]: The pre-update document (its 'status' is the previous status),
+                or None if nothing was restored.
+
+        Example:
+        ```python
+        previous = await repository.restore_if_archived('LEGACY_CODES', {'updatedBy': 'admin'})
+        if previous is None:
+            print("Missing or already active")
+        ```
+        """
+        return await self._set_status_unless(key, "active", update_fields)
+
+    async def _set_status_unless(self, key: str, status: str, update_fields: dict) -> Optional[dict]:
+        """Set status on a document not already in it; return the pre-update document or None."""
+        result = await self.collection.find_one_and_update(
+            {"key": key, "status": {"$ne": status}},
+            {"$set": {**update_fields, "status": status}},
+            return_document=ReturnDocument.BEFORE
+        )
+        if result:
+            result["_id"] = str(result["_id"])
+        return result
+
     async def get_statistics(self) -> Dict[str, Any]:
         """
         Generate comprehensive statistics about all value sets in the database.
@@ -1116,6 +1558,7 @@ class ValueSetRepository:
         • Uses MongoDB aggregation pipeline with $facet for multiple statistics
         • Calculates counts by status and module for categorization
         • Generates item-level statistics (total, average, min, max per value set)
+        • Derives total_capacity (500 per set) and capacity_used_percent in the pipeline
         • Handles empty database gracefully with zero values
         • Returns structured data suitable for dashboard visualization
 
@@ -1127,7 +1570,8 @@ class ValueSetRepository:
                 - 'total_value_sets' (int): Total number of value sets
                 - 'by_status' (dict): Count by status {'active': 10, 'archived': 2}
                 - 'by_module' (dict): Count by module {'core': 5, 'geography': 3}
-                - 'items_statistics' (dict): Item stats with 'total_items', 'avg_items', 'max_items', 'min_items'
+                - 'items_statistics' (dict): Item stats with 'total_items', 'avg_items', 'max_items', 'min_items',
+                  'total_capacity' and 'capacity_used_percent'
 
         Example:
         ```python
@@ -1164,9 +1608,27 @@ class ValueSetRepository:
                                 "total_items": {"$sum": {"$size": "$items"}},
                                 "avg_items": {"$avg": {"$size": "$items"}},
                                 "max_items": {"$max": {"$size": "$items"}},
-                                "min_items": {"$min": {"$size": "$items"}}
+                                "min_items": {"$min": {"$size": "$items"}},
+                                "set_count": {"$sum": 1}
                             }
-                        }
+                        },
+                        # Capacity is 500 items per value set
+                        {
+                            "$addFields": {
+                                "total_capacity": {"$multiply": ["$set_count", 500]},
+                                "capacity_used_percent": {
+                                    "$cond": [
+                                        {"$gt": ["$set_count", 0]},
+                                        {"$divide": [
+                                            {"$multiply": ["$total_items", 100]},
+                                            {"$multiply": ["$set_count", 500]}
+                                        ]},
+                                        0
+                                    ]
+                                }
+                            }
+                        },
+                        {"$project": {"set_count": 0}}
                     ]
                 }
             }
@@ -1200,8 +1662,9 @@ class ValueSetRepository:
         • Use this for transferring value sets between environments
 
         Business Logic:
-        • Retrieves complete value set document using find_by_key
-        • Removes MongoDB-specific fields (_id) for clean export
+        • Retrieves the value set document by key in a single find_one
+        • Excludes MongoDB-specific fields (_id) server-side via projection,
+          so the ObjectId is never decoded or stringified
         • Preserves all business data including items, metadata, and audit fields
         • Returns data suitable for JSON serialization and storage
         • Can be used with import_value_set for complete transfer
@@ -1232,11 +1695,49 @@ class ValueSetRepository:
             print("Value set not found for export")
         ```
         """
-        document = await self.find_by_key(key)
-        if document:
-            # Remove MongoDB-specific fields for clean export
-            document.pop("_id", None)
-        return document
+        # Exclude MongoDB-specific fields for clean export
+        return await self.collection.find_one({"key": key}, {"_id": 0})
+
+    async def export_value_set_items(self, key: str) -> Optional[dict]:
+        """
+        Fetch only the fields a tabular (CSV) export needs.
+
+        LLM Instructions:
+        • Use this for CSV exports, which need item codes and en/hi labels only
+        • Use export_value_set when the complete document is required (JSON export)
+
+        Business Logic:
+        • Projects key, module, status, items.code, items.labels.en and items.labels.hi
+        • Description, audit fields, _id and any other label languages stay on the server
+        • A value set holds at most 500 items, so one find_one is enough;
+          no $unwind cursor is needed
+
+        Args:
+            key (str): Unique value set key to identify the document to export.
+
+        Returns:
+            Optional[dict]: Projected document, or None if the value set key doesn't exist.
+
+        Example:
+        ```python
+        exported = await repository.export_value_set_items('COUNTRY_CODES')
+        if exported:
+            for item in exported['items']:
+                print(item['code'], item['labels'].get('en'))
+        ```
+        """
+        return await self.collection.find_one(
+            {"key": key},
+            {
+                "_id": 0,
+                "key": 1,
+                "module": 1,
+                "status": 1,
+                "items.code": 1,
+                "items.labels.en": 1,
+                "items.labels.hi": 1
+            }
+        )
 
     async def import_value_set(self, value_set_data: dict) -> dict:
         """
@@ -1332,6 +1833,37 @@ class ValueSetRepository:
         count = await self.collection.count_documents({"key": key})
         return count > 0
 
+    async def find_keys_in(self, keys: List[str]) -> List[str]:
+        """
+        Return which of the given value set keys already exist, in one query.
+
+        LLM Instructions:
+        • Use this instead of calling check_key_exists in a loop
+        • Use this when validating a batch of new keys before a bulk insert
+        • Convert the result to a set for membership checks
+
+        Business Logic:
+        • Issues one find with {'key': {'$in': keys}}
+        • Projects only the 'key' field, so no items are transferred
+        • Case-sensitive exact match on the key field
+        • Does not consider document status (archived vs active)
+
+        Args:
+            keys (List[str]): Value set keys to check for existence.
+
+        Returns:
+            List[str]: The subset of keys that exist in the database.
+
+        Example:
+        ```python
+        existing = set(await repository.find_keys_in(['DEPARTMENT_CODES', 'USER_ROLES']))
+        if 'USER_ROLES' in existing:
+            print("USER_ROLES is already taken")
+        ```
+        """
+        cursor = self.collection.find({"key": {"$in": keys}}, {"key": 1, "_id": 0})
+        return [document["key"] async for document in cursor]
+
     async def get_items_by_key(self, key: str) -> Optional[List[dict]]:
         """
         Retrieve only the items array from a value set without other metadata.
@@ -1380,4 +1912,41 @@ class ValueSetRepository:
             {"key": key},
             {"items": 1}
         )
-        return document["items"] if document else None
\ No newline at end of file
+        return document["items"] if document else None
+
+    async def get_item_codes(self, key: str) -> Optional[List[str]]:
+        """
+        Retrieve only the item codes of a value set.
+
+        LLM Instructions:
+        • Use this for duplicate-code and item-limit checks
+        • Prefer this over get_items_by_key when labels are not needed
+        • Use get_items_by_key when the item payload itself is required
+
+        Business Logic:
+        • Uses MongoDB projection to fetch only 'items.code'
+        • Labels never cross the wire, unlike get_items_by_key
+        • Preserves original item ordering
+        • Returns None if value set doesn't exist
+
+        Args:
+            key (str): Unique value set key to identify the document.
+
+        Returns:
+            Optional[List[str]]: Codes of the value set's items,
+                or None if the value set key doesn't exist.
+
+        Example:
+        ```python
+        codes = await repository.get_item_codes('COUNTRY_CODES')
+        if codes is not None and 'US' in codes:
+            print("US is already defined")
+        ```
+        """
+        document = await self.collection.find_one(
+            {"key": key},
+            {"items.code": 1, "_id": 0}
+        )
+        if document is None:
+            return None
+        return [item["code"] for item in document.get("items", [])]
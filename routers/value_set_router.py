@@ -5,7 +5,10 @@ File: /routers/value_set_router.py
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
+from urllib.parse import quote
+import re
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from datetime import datetime
 
@@ -25,7 +28,7 @@ from schemas.value_set_schemas_enhanced import (
     StatusEnum, ValueSetListItemSchema
 )
 
-router = APIRouter(prefix="/api/v1/value-sets", tags=["Value Sets"])
+router = APIRouter(prefix="/api/v1/value-sets", tags=["Value Sets"], default_response_class=ORJSONResponse)
 
 
 def get_value_set_service(db: AsyncIOMotorDatabase = Depends(get_db)) -> ValueSetService:
@@ -297,6 +300,8 @@ async def list_value_sets(
     module: Optional[str] = Query(None, description="Filter by module"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
+    include_total: bool = Query(True, description="Count all matching records"),
+    cursor: Optional[str] = Query(None, description="nextCursor from the previous page"),
     service: ValueSetService = Depends(get_value_set_service)
 ) -> PaginatedValueSetResponse:
     """
@@ -314,7 +319,10 @@ async def list_value_sets(
     • Applies module filter for exact string match if provided
     • Supports pagination with configurable skip/limit (max 1000 per page)
     • Returns summary information only (excludes full items list for performance)
-    • Includes total count for pagination controls
+    • Includes total count for pagination controls unless include_total is false
+    • Determines has_more from one extra fetched record, not from the total
+    • Supports keyset pagination via cursor; prefer it over large skip values
+    • Returns 400 for a malformed cursor, or a cursor combined with skip > 0
     • Does not include soft-deleted records
 
     Args:
@@ -327,15 +335,20 @@ async def list_value_sets(
             Must be >= 0. Default is 0 (start from beginning).
         limit (int): Maximum number of records to return per page.
             Must be between 1 and 1000. Default is 100.
+        include_total (bool): Whether to compute the total count of matching records.
+            Default is True. Set to False to skip the extra count query.
+        cursor (Optional[str]): Opaque nextCursor value from the previous page.
+            When given, results resume right after that page and skip must be 0.
         service (ValueSetService): Injected service for database operations.
 
     Returns:
         PaginatedValueSetResponse: Paginated response containing:
             - items (List[ValueSetListItemSchema]): Value set summaries (without full items)
-            - total (int): Total count matching filters
+            - total (Optional[int]): Total count matching filters, null if not requested
             - skip (int): Current skip offset
             - limit (int): Current page size
             - has_more (bool): Whether more records exist
+            - nextCursor (Optional[str]): Cursor for the next page, null on the last page
 
     Example:
     ```python
@@ -354,9 +367,14 @@ async def list_value_sets(
         status=status,
         module=module,
         skip=skip,
-        limit=limit
+        limit=limit,
+        includeTotal=include_total,
+        cursor=cursor
     )
-    return await service.list_value_sets(query_params)
+    try:
+        return await service.list_value_sets(query_params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 # 6. Search Value Set Items
@@ -999,6 +1017,40 @@ async def validate_value_set(
     return await service.validate_value_set(validation_request)
 
 
+# 17b. Validate Several Value Sets
+@router.post("/validate/bulk", response_model=List[ValidationResultSchema])
+async def validate_value_sets_bulk(
+    validation_requests: List[ValidateValueSetRequestSchema] = Body(..., min_length=1, max_length=100),
+    service: ValueSetService = Depends(get_value_set_service)
+) -> List[ValidationResultSchema]:
+    """
+    Validates several value sets in one request without persisting changes.
+
+    LLM Instructions:
+    • Use this endpoint instead of calling /validate once per value set
+    • Call this before saving a batch to catch issues early
+
+    Business Logic:
+    • Accepts 1-100 value sets per request
+    • Checks all keys against existing value sets with a single query
+    • Applies the same rules as /validate to each value set
+    • Returns one result per value set, in request order
+
+    Args:
+        validation_requests (List[ValidateValueSetRequestSchema]): Value sets to validate.
+        service (ValueSetService): Injected service for validation operations.
+
+    Returns:
+        List[ValidationResultSchema]: Validation results in request order.
+
+    Example:
+    ```python
+    results = await validate_value_sets_bulk([request_a, request_b], service)
+    ```
+    """
+    return await service.validate_value_sets_bulk(validation_requests)
+
+
 # 18. Archive Value Set
 @router.post("/{key}/archive", response_model=ArchiveRestoreResponseSchema)
 async def archive_value_set(
@@ -1190,6 +1242,7 @@ async def export_value_set(
     • Validates export format is supported before processing
     • Excludes sensitive or system-internal fields from export
     • Generates export in a format suitable for re-import or external consumption
+    • Serializes the export dict straight to JSON bytes with orjson (no jsonable_encoder pass)
 
     Args:
         key (str): Unique identifier of the value set to export.
@@ -1215,13 +1268,74 @@ async def export_value_set(
     ```
     """
     try:
-        return await service.export_value_set(key, format)
+        return ORJSONResponse(await service.export_value_set(key, format))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _csv_download_headers(key: str) -> dict:
+    """
+    Content-Disposition for a CSV download of a value set.
+
+    Keys are free-form strings, so the plain filename is an ASCII-safe fallback and
+    the exact name travels percent-encoded in filename* (RFC 6266), keeping the
+    latin-1 header valid for non-ASCII keys, quotes and line breaks.
+    """
+    fallback = re.sub(r"[^A-Za-z0-9._-]", "_", key)
+    return {
+        "Content-Disposition": f"attachment; filename=\"{fallback}.csv\"; filename*=UTF-8''{quote(key + '.csv', safe='')}"
+    }
+
+
+# 21b. Export Value Set as a CSV Download
+@router.get("/{key}/export/csv")
+async def export_value_set_csv(
+    key: str = Path(..., description="Value set key"),
+    service: ValueSetService = Depends(get_value_set_service)
+):
+    """
+    Streams a value set's items as a CSV file download.
+
+    LLM Instructions:
+    • Use this endpoint when users need a CSV file rather than a JSON envelope
+    • Call this for spreadsheet downloads of value set items
+    • Use /{key}/export?format=csv when the CSV is needed inside a JSON response
+
+    Business Logic:
+    • Checks the value set exists before the response starts (404 if not found)
+    • Streams rows in chunks as they are formatted instead of buffering the file
+    • Columns: Code, English Label, Hindi Label
+    • Sets Content-Disposition so browsers save the file as <key>.csv
+
+    Args:
+        key (str): Unique identifier of the value set to export.
+            Must be an existing value set.
+        service (ValueSetService): Injected service for export operations.
+
+    Returns:
+        StreamingResponse: text/csv body with a header row and one row per item.
+
+    Example:
+    ```python
+    response = await export_value_set_csv("medical_specialties", service)
+    ```
+    """
+    try:
+        rows = await service.export_value_set_csv_stream(key)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    return StreamingResponse(
+        rows,
+        media_type="text/csv",
+        headers=_csv_download_headers(key)
+    )
+
+
 # 22. Import Value Set
 @router.post("/import", response_model=ValueSetResponseSchema)
 async def import_value_set(
@@ -1280,8 +1394,53 @@ async def import_value_set(
         return await service.import_value_set(import_data, format, created_by)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except NotImplementedError as e:
-        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# 22b. Bulk Import Value Sets from Exports
+@router.post("/import/bulk", response_model=BulkOperationResponseSchema)
+async def import_value_sets_bulk(
+    import_data: List[dict] = Body(..., min_length=1, max_length=100, description="Exported value set documents to import"),
+    created_by: str = Query("system", description="User importing the value sets"),
+    skip_duplicates: bool = Query(False, description="Skip existing keys instead of failing"),
+    service: ValueSetService = Depends(get_value_set_service)
+) -> BulkOperationResponseSchema:
+    """
+    Imports many exported value sets in one request for migrations and restores.
+
+    LLM Instructions:
+    • Use this endpoint instead of calling /import once per value set
+    • Call this with skip_duplicates=true to re-run a partially applied migration
+    • Use /bulk/import when the value sets are authored rather than exported
+
+    Business Logic:
+    • Accepts 1-100 value sets; each is validated like a single /import
+    • Reports invalid value sets by index without writing them
+    • Checks all keys against existing value sets with a single query
+    • Fails with 400 on repeated or existing keys unless skip_duplicates is set
+    • Inserts the remaining value sets in one unordered write
+    • Sets createdAt/createdBy audit fields; clears updatedAt/updatedBy
+
+    Args:
+        import_data (List[dict]): Value set documents as returned by /{key}/export.
+        created_by (str): User ID responsible for the import operation.
+            Defaults to "system" for automated imports.
+        skip_duplicates (bool): Skip existing keys and report them as failures.
+        service (ValueSetService): Injected service for import operations.
+
+    Returns:
+        BulkOperationResponseSchema: Counts, per-item errors and the keys created.
+
+    Example:
+    ```python
+    result = await import_value_sets_bulk(exported_sets, "migration", True, service)
+    ```
+    """
+    try:
+        return await service.import_value_sets_bulk(import_data, created_by, skip_duplicates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -132,6 +132,8 @@ class ListValueSetsQuerySchema(BaseModel):
     module: Optional[str] = None
     skip: int = Field(0, ge=0, description="Number of records to skip")
     limit: int = Field(100, ge=1, le=1000, description="Maximum records to return")
+    includeTotal: bool = Field(True, description="Count all matching records (costs an extra query)")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's nextCursor")
 
 
 class SearchItemsQuerySchema(BaseModel):
@@ -154,11 +156,12 @@ class SearchItemsResponseSchema(BaseModel):
 # ==========================
 class PaginatedValueSetResponse(BaseModel):
     """Paginated response for value set listings."""
-    total: int = Field(..., description="Total number of value sets matching criteria")
+    total: Optional[int] = Field(None, description="Total number of value sets matching criteria, if requested")
     skip: int = Field(..., description="Number of records skipped")
     limit: int = Field(..., description="Maximum records returned")
     items: List[ValueSetListItemSchema] = Field(..., description="List of value sets")
     hasMore: bool = Field(..., description="Whether more results are available")
+    nextCursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 class PaginatedSearchResponse(BaseModel):
@@ -297,7 +300,7 @@ class BulkOperationResponseSchema(BaseModel):
     """Response for bulk operations."""
     successful: int = Field(..., description="Count of successful operations")
     failed: int = Field(..., description="Count of failed operations")
-    errors: List[Dict[str, str]] = Field(default_factory=list, description="Error details")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="Error details")
     processedKeys: List[str] = Field(default_factory=list, description="Successfully processed keys")
 
 
@@ -4,12 +4,17 @@ Handles validation, business rules, and audit fields.
 File: /services/value_set_service.py
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import copy
+from collections import Counter
+from operator import itemgetter
+from typing import List, Optional, Dict, Any, AsyncIterator, Set
+from datetime import datetime, timezone
+from pydantic import TypeAdapter
 from repositories.value_set_repository import ValueSetRepository
 from schemas.value_set_schemas_enhanced import (
     ValueSetCreateSchema, ValueSetUpdateSchema, ValueSetResponseSchema,
-    ItemCreateSchema, ItemUpdateSchema, ItemSchema,
+    ItemCreateSchema, ItemUpdateSchema, ItemSchema, LabelSchema,
     AddItemRequestSchema, UpdateItemRequestSchema,
     ReplaceItemCodeSchema, BulkValueSetCreateSchema, BulkValueSetUpdateSchema,
     BulkItemUpdateSchema, ValidateValueSetRequestSchema, ValidationResultSchema,
@@ -17,11 +22,416 @@ from schemas.value_set_schemas_enhanced import (
     ListValueSetsQuerySchema, SearchItemsQuerySchema, SearchItemsResponseSchema,
     PaginatedValueSetResponse, PaginatedSearchResponse,
     BulkOperationResponseSchema, ErrorResponseSchema,
-    ValueSetListItemSchema
+    ValueSetListItemSchema, StatusEnum
 )
 import json
-from io import StringIO
+import base64
+import binascii
 import csv
+import re
+from io import StringIO
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
+from cachetools import TTLCache
+
+
+# Cached list adapters: serialize a whole items list in one pydantic-core call
+# instead of dispatching model_dump() per item.
+_ITEM_LIST_ADAPTER = TypeAdapter(List[ItemCreateSchema])
+_ITEM_SCHEMA_LIST_ADAPTER = TypeAdapter(List[ItemSchema])
+_VALUE_SET_LIST_ADAPTER = TypeAdapter(List[ValueSetCreateSchema])
+
+# Stored string for each status, looked up once per write instead of via .value
+_STATUS_VALUE: Dict[StatusEnum, str] = {status: status.value for status in StatusEnum}
+
+# Every accepted status string, kept in step with StatusEnum
+_ALLOWED_STATUSES = frozenset(_STATUS_VALUE.values())
+
+# Audit fields every imported value set starts with
+_IMPORT_AUDIT_DEFAULTS = {"updatedAt": None, "updatedBy": None}
+
+# Re-reads of the codes after a refused add before giving up; each one means
+# another writer changed the value set between our read and our write
+_ADD_ITEM_ATTEMPTS = 3
+
+# Bumped by every value set write in this process. Reads capture it before going
+# to the database, so a write that lands meanwhile keeps their result out of a cache.
+_write_version = 0
+
+# Read-through cache for get_value_set_by_key. Services are built per request,
+# so the cache lives at module scope and is shared by every instance. Writes only
+# invalidate it in this process; with several workers, the TTL bounds how long
+# another worker can serve a value set from before a write.
+_VALUE_SET_CACHE_TTL = 5
+_value_set_cache: TTLCache = TTLCache(maxsize=1024, ttl=_VALUE_SET_CACHE_TTL)
+
+# System-wide statistics per database, stored with the write version they were
+# read at. _write_version only counts writes in this process, so with several
+# workers the TTL bounds how long another worker's writes go unseen.
+_stats_cache: TTLCache = TTLCache(maxsize=16, ttl=30)
+
+# Strong references to fire-and-forget tasks; the event loop only keeps weak ones
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Schedule a coroutine and keep it referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+class _KeyBatchLoader:
+    """
+    Coalesce find_by_key lookups issued in the same event-loop tick into one $in query.
+
+    Lookups are grouped per database, so per-request repositories that share
+    the application's database join the same batch. The batch is dispatched
+    by a task scheduled when its first key is queued, i.e. once every coroutine
+    that is currently runnable has had the chance to add its key.
+    """
+
+    def __init__(self):
+        self._batches: Dict[int, tuple] = {}
+
+    async def load(self, repository: ValueSetRepository, key: str) -> Optional[dict]:
+        batch_id = id(repository.db)
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            batch = (repository, {})
+            self._batches[batch_id] = batch
+            _spawn(self._dispatch(batch_id))
+
+        futures = batch[1]
+        future = futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            # Retrieve the outcome even if every caller is cancelled, so asyncio does not log it as never retrieved
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            futures[key] = future
+
+        # Shield the shared future so one cancelled caller does not cancel the others
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, batch_id: int) -> None:
+        repository, futures = self._batches.pop(batch_id)
+        try:
+            documents = await repository.find_by_keys(list(futures))
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in futures.items():
+            if not future.done():
+                future.set_result(documents.get(key))
+
+
+_key_loader = _KeyBatchLoader()
+
+
+class _AddItemBatcher:
+    """
+    Coalesce add_item_to_value_set calls issued in the same event-loop tick.
+
+    Requests are grouped per database, then per value set key, then per
+    updatedBy, so every write is attributed to the user who asked for it.
+    Each group is written with one guarded $push/$each update however many
+    items were queued in it; keys are written concurrently and the groups of
+    one key in turn. Codes are only read when that write is refused, and every
+    request is then validated on its own, in arrival order, so callers see the
+    same result or ValueError they would get from a standalone add. A group
+    whose writes keep being refused for reasons the codes cannot explain gives
+    up after _ADD_ITEM_ATTEMPTS re-reads. Each caller gets its own copy of the
+    updated document.
+    """
+
+    def __init__(self):
+        self._batches: Dict[int, tuple] = {}
+
+    async def add(self, repository: ValueSetRepository, key: str, request: AddItemRequestSchema) -> Optional[dict]:
+        batch_id = id(repository.db)
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            batch = (repository, {})
+            self._batches[batch_id] = batch
+            _spawn(self._dispatch(batch_id))
+
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the outcome even if the caller is cancelled, so asyncio does not log it as never retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        batch[1].setdefault(key, {}).setdefault(request.updatedBy, []).append((request, future))
+
+        # Shield the future so a cancelled caller does not drop the write for others
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, batch_id: int) -> None:
+        repository, pending = self._batches.pop(batch_id)
+        await asyncio.gather(*(
+            self._add_to_key(repository, key, groups)
+            for key, groups in pending.items()
+        ))
+
+    async def _add_to_key(self, repository: ValueSetRepository, key: str, groups: dict) -> None:
+        for requests in groups.values():
+            await self._add_group(repository, key, requests)
+
+    @staticmethod
+    async def _push(repository: ValueSetRepository, key: str, requests: list) -> Optional[dict]:
+        return await repository.add_items(
+            key,
+            _ITEM_LIST_ADAPTER.dump_python([request.item for request, _ in requests], mode="python"),
+            {
+                "updatedAt": _utcnow(),
+                "updatedBy": requests[-1][0].updatedBy
+            }
+        )
+
+    async def _add_group(self, repository: ValueSetRepository, key: str, requests: list) -> None:
+        try:
+            # Happy path: the update filter itself rejects taken codes and a full set
+            accepted = requests
+            result = None
+            if len(requests) <= 500 and len({request.item.code for request, _ in requests}) == len(requests):
+                result = await self._push(repository, key, accepted)
+
+            for _ in range(_ADD_ITEM_ATTEMPTS):
+                if result is not None:
+                    break
+
+                # Work out why the write was refused, then retry with what still fits
+                current_codes = await repository.get_item_codes(key)
+                if current_codes is None:
+                    for _, future in accepted:
+                        future.set_result(None)
+                    return
+
+                # Validate each request against the codes accepted so far
+                codes = set(current_codes)
+                pending, accepted = accepted, []
+                for request, future in pending:
+                    code = request.item.code
+                    if code in codes:
+                        future.set_exception(ValueError(f"Item with code '{code}' already exists"))
+                    elif len(codes) >= 500:
+                        future.set_exception(ValueError("Maximum number of items (500) reached"))
+                    else:
+                        codes.add(code)
+                        accepted.append((request, future))
+
+                if not accepted:
+                    return
+
+                result = await self._push(repository, key, accepted)
+
+            if result is None:
+                # Other writers kept changing the value set between each read and write
+                for request, future in accepted:
+                    future.set_exception(ValueError(
+                        f"Value set '{key}' was modified concurrently; item '{request.item.code}' was not added"
+                    ))
+                return
+
+            for _, future in accepted:
+                future.set_result(copy.deepcopy(result))
+        except Exception as e:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+
+
+_add_item_batcher = _AddItemBatcher()
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching what PyMongo reads back."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _remap_error_indexes(errors: list, request_indexes: list) -> list:
+    """Point write errors, indexed into the documents actually sent, back at request positions."""
+    return [{**error, "index": request_indexes[error["index"]]} for error in errors]
+
+
+def _assert_unique_codes(items) -> None:
+    """Raise ValueError if any item code appears more than once."""
+    codes = [item.code for item in items]
+    if len(codes) != len(set(codes)):
+        raise ValueError("Item codes must be unique within the value set")
+
+
+def _item_updates(updates: ItemUpdateSchema) -> dict:
+    """Build the item fields to $set from an ItemUpdateSchema, dropping unset ones."""
+    item_updates = {}
+    if updates.code:
+        item_updates["code"] = updates.code
+    labels = updates.labels
+    if labels:
+        # An empty English label is ignored; an empty Hindi label clears it
+        labels_update = {k: v for k, v in (("en", labels.en or None), ("hi", labels.hi)) if v is not None}
+        if labels_update:
+            item_updates["labels"] = labels_update
+    return item_updates
+
+
+def _encode_cursor(document: dict) -> str:
+    """Encode a list document's (createdAt, _id) position as an opaque cursor; a missing createdAt encodes as null."""
+    created_at = document.get("createdAt")
+    payload = json.dumps({"c": created_at.isoformat() if created_at else None, "i": str(document["_id"])})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor from _encode_cursor, raising ValueError if it is malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = payload["c"]
+        return datetime.fromisoformat(created_at) if created_at is not None else None, ObjectId(payload["i"])
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, InvalidId) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+# CSV layout shared by export and import, and how many rows go into each streamed chunk
+_CSV_COLUMNS = ["Code", "English Label", "Hindi Label"]
+_CSV_HEADER = ",".join(_CSV_COLUMNS) + "\r\n"
+_CSV_CHUNK_ROWS = 100
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_NEEDS_QUOTE = re.compile(r'[,"\r\n]')
+
+
+def _csv_field(value: Optional[str]) -> str:
+    """Format one CSV field exactly as csv.writer would for this fixed schema."""
+    if not value:
+        return ""
+    if _CSV_NEEDS_QUOTE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+async def _iter_csv(items: List[dict]) -> AsyncIterator[str]:
+    """
+    Yield a value set's items as CSV text, _CSV_CHUNK_ROWS rows per chunk.
+
+    Rows for the fixed three-column schema are formatted directly rather than
+    through csv.writer; labels rarely need quoting, so most fields pass through
+    untouched. Memory stays bounded by the chunk size, not the whole export.
+    """
+    rows = [_CSV_HEADER]
+    for item in items:
+        labels = item["labels"]
+        rows.append(
+            f"{_csv_field(item['code'])},{_csv_field(labels.get('en'))},{_csv_field(labels.get('hi'))}\r\n"
+        )
+        if len(rows) == _CSV_CHUNK_ROWS:
+            yield "".join(rows)
+            rows = []
+
+    if rows:
+        yield "".join(rows)
+
+
+def _validated_import(data: dict, items: list, created_by: str) -> dict:
+    """
+    Validate an imported value set through ValueSetCreateSchema and return its document fields.
+
+    Imports are checked like creates, so anything written is trusted by the
+    response path. Fields other than key/status/module/description/items are dropped.
+    """
+    value_set = ValueSetCreateSchema(
+        key=data.get("key"),
+        status=data.get("status", StatusEnum.ACTIVE),
+        module=data.get("module", "Core"),
+        description=data.get("description"),
+        items=items,
+        createdBy=created_by
+    )
+    return {
+        "key": value_set.key,
+        "status": _STATUS_VALUE[value_set.status],
+        "module": value_set.module,
+        "description": value_set.description,
+        "items": _ITEM_LIST_ADAPTER.dump_python(value_set.items, mode="python")
+    }
+
+
+def _value_set_from_csv(import_data: dict, created_by: str) -> dict:
+    """
+    Turn a CSV export envelope ({"content": ..., "metadata": {...}}) back into a value set dict.
+
+    Rows are read lazily from the content and validated through ValueSetCreateSchema,
+    so malformed input raises ValueError before anything is written.
+    """
+    content = import_data.get("content")
+    metadata = import_data.get("metadata")
+    if not isinstance(content, str) or not isinstance(metadata, dict):
+        raise ValueError("CSV import requires 'content' (CSV text) and 'metadata' (key, module, status, description)")
+
+    rows = csv.reader(StringIO(content, newline=""))
+    header = next(rows, None)
+    if header != _CSV_COLUMNS:
+        raise ValueError(f"CSV header must be: {_CSV_HEADER.strip()}")
+
+    def items():
+        for row in rows:
+            if not row:
+                continue
+            if len(row) != len(_CSV_COLUMNS):
+                raise ValueError(f"CSV line {rows.line_num} must have {len(_CSV_COLUMNS)} columns")
+            yield {"code": row[0], "labels": {"en": row[1], "hi": row[2] or None}}
+
+    return _validated_import(metadata, list(items()), created_by)
+
+
+def _csv_import_key(import_data: dict) -> Optional[str]:
+    """Key of a CSV import envelope, or None if its metadata is missing."""
+    metadata = import_data.get("metadata")
+    return metadata.get("key") if isinstance(metadata, dict) else None
+
+
+def _value_set_from_json(import_data: dict, created_by: str) -> dict:
+    """Validate a JSON import (e.g. a JSON export) into a new document dict."""
+    return _validated_import(import_data, import_data.get("items"), created_by)
+
+
+# Import formats: how to read the key up front, and how to build the document
+_IMPORT_FORMATS = {
+    "json": (lambda data: data.get("key"), _value_set_from_json),
+    "csv": (_csv_import_key, _value_set_from_csv),
+}
+
+
+def _prepare_import_document(import_data: dict, parse, created_by: str, created_at: datetime) -> dict:
+    """Parse a value set being imported and stamp its audit fields."""
+    document = parse(import_data, created_by)
+    document["createdAt"] = created_at
+    document["createdBy"] = created_by
+    document.update(_IMPORT_AUDIT_DEFAULTS)
+    return document
+
+
+def _item_from_doc(item: dict) -> ItemSchema:
+    """Build an ItemSchema from a stored item without re-running validation."""
+    return ItemSchema.model_construct(
+        code=item["code"],
+        labels=LabelSchema.model_construct(**item["labels"])
+    )
+
+
+def _value_set_from_doc(document: dict) -> ValueSetResponseSchema:
+    """
+    Build a ValueSetResponseSchema from a repository document without re-validation.
+
+    Repository documents are written through the same schemas, so the data is
+    trusted and model_construct skips the per-field validator dispatch.
+    """
+    return ValueSetResponseSchema.model_construct(**{
+        **document,
+        "items": [_item_from_doc(item) for item in document.get("items", [])]
+    })
 
 
 class ValueSetService:
@@ -74,7 +484,8 @@ class ValueSetService:
         Business Logic:
         • Stores repository reference for all database operations
         • No validation performed at initialization
-        • Service remains stateless except for repository dependency
+        • Shares the module-level read cache across instances, since a new
+          service is created for every request
 
         Args:
             repository (ValueSetRepository): Repository instance for database operations.
@@ -93,6 +504,13 @@ class ValueSetService:
         ```
         """
         self.repository = repository
+        self._cache = _value_set_cache
+
+    def _invalidate(self, key: str) -> None:
+        """Drop any cached read of a value set after it has been written."""
+        global _write_version
+        self._cache.pop(key, None)
+        _write_version += 1
 
     async def create_value_set(self, create_data: ValueSetCreateSchema) -> ValueSetResponseSchema:
         """
@@ -147,35 +565,50 @@ class ValueSetService:
         value_set = await service.create_value_set(create_data)
         ```
         """
-        # Check if key already exists
-        if await self.repository.check_key_exists(create_data.key):
-            raise ValueError(f"Value set with key '{create_data.key}' already exists")
+        # Start the key lookup first; yielding once hands the query to the
+        # driver so its round-trip overlaps the item validation below
+        exists_task = asyncio.create_task(self.repository.check_key_exists(create_data.key))
+        await asyncio.sleep(0)
+
+        try:
+            # Validate unique item codes
+            _assert_unique_codes(create_data.items)
 
-        # Validate unique item codes
-        item_codes = [item.code for item in create_data.items]
-        if len(item_codes) != len(set(item_codes)):
-            raise ValueError("Item codes must be unique within the value set")
+            # Validate item count
+            if not (1 <= len(create_data.items) <= 500):
+                raise ValueError("Number of items must be between 1 and 500")
 
-        # Validate item count
-        if not (1 <= len(create_data.items) <= 500):
-            raise ValueError("Number of items must be between 1 and 500")
+            items_dump = _ITEM_LIST_ADAPTER.dump_python(create_data.items, mode="python")
+        except ValueError:
+            # A duplicate key is still reported ahead of item errors
+            if await exists_task:
+                raise ValueError(f"Value set with key '{create_data.key}' already exists")
+            raise
+
+        # Check if key already exists
+        if await exists_task:
+            raise ValueError(f"Value set with key '{create_data.key}' already exists")
 
         # Prepare document
         document = {
             "key": create_data.key,
-            "status": create_data.status.value,
+            "status": _STATUS_VALUE[create_data.status],
             "module": create_data.module,
             "description": create_data.description,
-            "items": [item.model_dump() for item in create_data.items],
-            "createdAt": create_data.createdAt or datetime.utcnow(),
+            "items": items_dump,
+            "createdAt": create_data.createdAt or _utcnow(),
             "createdBy": create_data.createdBy,
             "updatedAt": None,
             "updatedBy": None
         }
 
-        # Create in database
-        result = await self.repository.create(document)
-        return ValueSetResponseSchema(**result)
+        # Create in database; the unique key index catches a create that raced the check above
+        try:
+            result = await self.repository.create(document)
+        except DuplicateKeyError:
+            raise ValueError(f"Value set with key '{create_data.key}' already exists")
+        self._invalidate(create_data.key)
+        return _value_set_from_doc(result)
 
     async def get_value_set_by_key(self, key: str) -> Optional[ValueSetResponseSchema]:
         """
@@ -188,7 +621,14 @@ class ValueSetService:
         • Use for read operations where key is known
 
         Business Logic:
-        • Performs direct key lookup in the database
+        • Serves hot keys from a short-TTL in-process cache (5s); each caller
+          gets its own deep copy, so mutating the result never touches the cache
+        • On a cache miss, looks the key up in the database; concurrent misses in
+          the same event-loop tick share one {'key': {'$in': [...]}} query
+        • Cache entries are dropped by every write path for that key, and a read
+          that overlapped a write is returned but not cached
+        • Invalidation is per process: with several workers, another worker may
+          serve the pre-write value set until its entry expires (up to 5s)
         • Returns complete value set data including all items
         • No filtering or validation applied
         • Case-sensitive key matching
@@ -211,9 +651,18 @@ class ValueSetService:
             print("Value set not found")
         ```
         """
-        document = await self.repository.find_by_key(key)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        # A write that lands while the lookup runs makes this read unsafe to cache
+        version = _write_version
+        document = await _key_loader.load(self.repository, key)
         if document:
-            return ValueSetResponseSchema(**document)
+            value_set = _value_set_from_doc(document)
+            if version == _write_version:
+                self._cache[key] = value_set.model_copy(deep=True)
+            return value_set
         return None
 
     async def update_value_set(
@@ -238,6 +687,8 @@ class ValueSetService:
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Only updates fields that are explicitly provided (partial update)
         • Preserves existing data for fields not in update request
+        • Returns the existing value set without writing (audit fields untouched)
+          when no status, description, module or items are supplied
 
         Args:
             key (str): Unique identifier of the value set to update.
@@ -272,39 +723,52 @@ class ValueSetService:
             print(f"Updated value set: {updated_vs.key}")
         ```
         """
-        # Check if value set exists
-        existing = await self.repository.find_by_key(key)
-        if not existing:
-            return None
+        # Look up the value set while the items are validated
+        existing_task = asyncio.create_task(self.repository.find_by_key(key))
+        await asyncio.sleep(0)
 
         # Validate items if provided
-        if update_data.items:
-            item_codes = [item.code for item in update_data.items]
-            if len(item_codes) != len(set(item_codes)):
-                raise ValueError("Item codes must be unique within the value set")
+        try:
+            if update_data.items:
+                _assert_unique_codes(update_data.items)
+
+                if not (1 <= len(update_data.items) <= 500):
+                    raise ValueError("Number of items must be between 1 and 500")
+        except ValueError:
+            # A missing value set is still reported ahead of item errors
+            if not await existing_task:
+                return None
+            raise
 
-            if not (1 <= len(update_data.items) <= 500):
-                raise ValueError("Number of items must be between 1 and 500")
+        # Check if value set exists
+        existing = await existing_task
+        if not existing:
+            return None
 
         # Prepare update fields
         update_fields = {
-            "updatedAt": update_data.updatedAt or datetime.utcnow(),
+            "updatedAt": update_data.updatedAt or _utcnow(),
             "updatedBy": update_data.updatedBy
         }
 
         if update_data.status:
-            update_fields["status"] = update_data.status.value
+            update_fields["status"] = _STATUS_VALUE[update_data.status]
         if update_data.description is not None:
             update_fields["description"] = update_data.description
         if update_data.module:
             update_fields["module"] = update_data.module
         if update_data.items:
-            update_fields["items"] = [item.model_dump() for item in update_data.items]
+            update_fields["items"] = _ITEM_SCHEMA_LIST_ADAPTER.dump_python(update_data.items, mode="python")
+
+        # Skip the write when nothing but the audit fields would change
+        if update_fields.keys() == {"updatedAt", "updatedBy"}:
+            return _value_set_from_doc(existing)
 
         # Update in database
         result = await self.repository.update_by_key(key, update_fields)
+        self._invalidate(key)
         if result:
-            return ValueSetResponseSchema(**result)
+            return _value_set_from_doc(result)
         return None
 
 
@@ -325,9 +789,12 @@ class ValueSetService:
         Business Logic:
         • Builds filter query based on optional status and module parameters
         • Applies pagination with skip/limit for performance
-        • Transforms documents to include calculated itemCount field
+        • Fetches summaries with itemCount computed by the database (items not transferred)
         • Returns lightweight list items (not full value set data)
-        • Calculates hasMore flag based on total count and current page
+        • Calculates hasMore by fetching one record past the current page
+        • Counts matching records only when includeTotal is set (total is None otherwise)
+        • Supports keyset pagination: pass the previous page's nextCursor as cursor
+          to resume after it without paying for skip; skip must then be 0
 
         Args:
             query_params (ListValueSetsQuerySchema): Query parameters containing:
@@ -335,15 +802,21 @@ class ValueSetService:
                 - module (Optional[str]): Filter by module/category
                 - skip (int): Number of records to skip (default: 0, for pagination)
                 - limit (int): Maximum records to return (default: 50, max: 100)
+                - includeTotal (bool): Whether to count all matching records (default: True)
+                - cursor (Optional[str]): nextCursor from the previous page, if any
 
         Returns:
             PaginatedValueSetResponse: Paginated response containing:
-                - total (int): Total count of matching records
+                - total (Optional[int]): Total count of matching records, None if not requested
                 - skip (int): Number of records skipped
                 - limit (int): Maximum records per page
                 - hasMore (bool): Whether more pages are available
+                - nextCursor (Optional[str]): Cursor for the next page, None on the last page
                 - items (List[ValueSetListItemSchema]): List of value set summaries with itemCount
 
+        Raises:
+            ValueError: If the cursor is malformed or combined with skip > 0
+
         Example:
         ```python
         from schemas.value_set_schemas_enhanced import ListValueSetsQuerySchema
@@ -359,34 +832,36 @@ class ValueSetService:
         print(f"Found {response.total} value sets, showing {len(response.items)}")
         ```
         """
+        # A cursor already marks where the page starts; skipping past it too would drop records
+        if query_params.cursor and query_params.skip:
+            raise ValueError("skip cannot be combined with cursor")
+
         # Build filter query
         filter_query = {}
         if query_params.status:
-            filter_query["status"] = query_params.status.value
+            filter_query["status"] = _STATUS_VALUE[query_params.status]
         if query_params.module:
             filter_query["module"] = query_params.module
 
-        # Get results from repository
-        documents, total = await self.repository.list_value_sets(
+        # Get summaries from repository (itemCount is computed in MongoDB)
+        documents, total, has_more = await self.repository.list_value_sets_summary(
             filter_query,
             skip=query_params.skip,
-            limit=query_params.limit
+            limit=query_params.limit,
+            include_total=query_params.includeTotal,
+            after=_decode_cursor(query_params.cursor) if query_params.cursor else None
         )
 
         # Transform to response schema
-        items = []
-        for doc in documents:
-            items.append(ValueSetListItemSchema(
-                **doc,
-                itemCount=len(doc.get("items", []))
-            ))
+        items = [ValueSetListItemSchema.model_construct(**doc) for doc in documents]
 
         return PaginatedValueSetResponse(
             total=total,
             skip=query_params.skip,
             limit=query_params.limit,
             items=items,
-            hasMore=(query_params.skip + query_params.limit) < total
+            hasMore=has_more,
+            nextCursor=_encode_cursor(documents[-1]) if has_more else None
         )
 
     async def search_value_set_items(
@@ -444,16 +919,16 @@ class ValueSetService:
             search_params.languageCode
         )
 
-        response_items = []
-        for result in results:
-            response_items.append(SearchItemsResponseSchema(
+        # Repository output is trusted, so results are constructed without re-validation
+        return [
+            SearchItemsResponseSchema.model_construct(
                 valueSetKey=result["key"],
                 valueSetModule=result.get("module", ""),
-                matchingItems=[ItemSchema(**item) for item in result["matchingItems"]],
+                matchingItems=[_item_from_doc(item) for item in result["matchingItems"]],
                 totalMatches=len(result["matchingItems"])
-            ))
-
-        return response_items
+            )
+            for result in results
+        ]
 
     async def search_value_sets_by_label(
         self,
@@ -510,7 +985,7 @@ class ValueSetService:
             status
         )
 
-        return [ValueSetResponseSchema(**doc) for doc in results]
+        return [_value_set_from_doc(doc) for doc in results]
 
     async def add_item_to_value_set(
         self,
@@ -534,6 +1009,12 @@ class ValueSetService:
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Preserves all existing items while adding the new one
         • Maintains item order (new item appended to end)
+        • Uniqueness and the limit are part of the $push filter; codes are only
+          read to explain a refused write
+        • Concurrent calls for the same key and updatedBy in one event-loop tick
+          are coalesced into a single $push write
+        • A refused write the codes cannot explain (a concurrent change slipped
+          in between) is retried up to 3 times
 
         Args:
             key (str): Unique identifier of the target value set.
@@ -548,7 +1029,8 @@ class ValueSetService:
                 None if value set not found. Contains all existing items plus the new one.
 
         Raises:
-            ValueError: If item code already exists in value set or 500-item limit exceeded
+            ValueError: If item code already exists in value set, 500-item limit exceeded,
+                or the value set kept changing concurrently across every attempt
 
         Example:
         ```python
@@ -565,35 +1047,13 @@ class ValueSetService:
             print(f"Added item, now has {len(updated_vs.items)} items")
         ```
         """
-        # Get current items
-        current_items = await self.repository.get_items_by_key(key)
-        if current_items is None:
+        # Validate and add; concurrent adds to the same key share one lookup and one write
+        result = await _add_item_batcher.add(self.repository, key, request)
+        if result is None:
             return None
 
-        # Check if code already exists
-        existing_codes = [item["code"] for item in current_items]
-        if request.item.code in existing_codes:
-            raise ValueError(f"Item with code '{request.item.code}' already exists")
-
-        # Check item limit
-        if len(current_items) >= 500:
-            raise ValueError("Maximum number of items (500) reached")
-
-        # Add item
-        update_fields = {
-            "updatedAt": datetime.utcnow(),
-            "updatedBy": request.updatedBy
-        }
-
-        result = await self.repository.add_item(
-            key,
-            request.item.model_dump(),
-            update_fields
-        )
-
-        if result:
-            return ValueSetResponseSchema(**result)
-        return None
+        self._invalidate(key)
+        return _value_set_from_doc(result)
 
     async def update_item_in_value_set(
         self,
@@ -613,6 +1073,10 @@ class ValueSetService:
         Business Logic:
         • Validates value set and target item exist
         • Checks for code conflicts if updating item code
+        • Both checks are part of the single update query; the items are only
+          re-read to explain a failed update
+        • A failed update the re-read codes cannot explain (the items changed in
+          between) is retried once, then reported as a concurrent modification
         • Supports partial updates (code and/or labels)
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Preserves existing item data for fields not being updated
@@ -633,7 +1097,8 @@ class ValueSetService:
                 None if value set not found. Contains all items with updates applied.
 
         Raises:
-            ValueError: If target item not found or new code conflicts with existing item
+            ValueError: If target item not found, new code conflicts with existing item,
+                or the item was modified concurrently on both attempts
 
         Example:
         ```python
@@ -652,50 +1117,41 @@ class ValueSetService:
         updated_vs = await service.update_item_in_value_set("test-key", request)
         ```
         """
-        # Get current items to validate
-        current_items = await self.repository.get_items_by_key(key)
-        if current_items is None:
-            return None
-
-        # Check if item exists
-        item_exists = any(item["code"] == request.itemCode for item in current_items)
-        if not item_exists:
-            raise ValueError(f"Item with code '{request.itemCode}' not found")
-
-        # If updating code, check for conflicts
-        if request.updates.code:
-            existing_codes = [item["code"] for item in current_items if item["code"] != request.itemCode]
-            if request.updates.code in existing_codes:
-                raise ValueError(f"Item with code '{request.updates.code}' already exists")
-
         # Prepare updates
-        item_updates = {}
-        if request.updates.code:
-            item_updates["code"] = request.updates.code
-        if request.updates.labels:
-            labels_update = {}
-            if request.updates.labels.en:
-                labels_update["en"] = request.updates.labels.en
-            if request.updates.labels.hi is not None:
-                labels_update["hi"] = request.updates.labels.hi
-            if labels_update:
-                item_updates["labels"] = labels_update
+        item_updates = _item_updates(request.updates)
 
         update_fields = {
-            "updatedAt": datetime.utcnow(),
+            "updatedAt": _utcnow(),
             "updatedBy": request.updatedBy
         }
 
-        result = await self.repository.update_item(
-            key,
-            request.itemCode,
-            item_updates,
-            update_fields
-        )
+        new_code = request.updates.code
+        for _ in range(2):
+            # Existence and code conflicts are enforced by the update filter itself
+            result = await self.repository.update_item(
+                key,
+                request.itemCode,
+                item_updates,
+                update_fields
+            )
 
-        if result:
-            return ValueSetResponseSchema(**result)
-        return None
+            if result:
+                self._invalidate(key)
+                return _value_set_from_doc(result)
+
+            # Work out why nothing matched only on the failure path
+            current_codes = await self.repository.get_item_codes(key)
+            if current_codes is None:
+                return None
+
+            current_codes = set(current_codes)
+            if request.itemCode not in current_codes:
+                raise ValueError(f"Item with code '{request.itemCode}' not found")
+            if new_code and new_code != request.itemCode and new_code in current_codes:
+                raise ValueError(f"Item with code '{new_code}' already exists")
+            # Neither explains the miss: the items changed in between, so try once more
+
+        raise ValueError(f"Item with code '{request.itemCode}' was modified concurrently; please retry")
 
 
     async def bulk_add_items(
@@ -716,8 +1172,8 @@ class ValueSetService:
 
         Business Logic:
         • Validates value set exists before processing items
-        • Checks for duplicate codes between existing and new items
-        • Enforces 500-item total limit (existing + new items)
+        • Enforces 500-item total limit (existing + new items) before any code comparison
+        • Checks for duplicate codes between existing and new items, and within the new items
         • Performs atomic bulk addition (all succeed or all fail)
         • Updates audit fields: updatedAt (current time), updatedBy (provided)
         • Maintains performance by using single database operation
@@ -752,50 +1208,63 @@ class ValueSetService:
         print(f"Added {response.successful} items, {response.failed} failed")
         ```
         """
-        # Get current items
-        current_items = await self.repository.get_items_by_key(key)
-        if current_items is None:
+        # Get current item codes
+        current_codes = await self.repository.get_item_codes(key)
+        if current_codes is None:
             return BulkOperationResponseSchema(
                 successful=0,
                 failed=len(items),
                 errors=[{"key": key, "error": "Value set not found"}]
             )
 
-        # Check for duplicate codes
-        existing_codes = set(item["code"] for item in current_items)
-        new_codes = [item.code for item in items]
+        new_count = len(items)
 
-        duplicates = [code for code in new_codes if code in existing_codes]
-        if duplicates:
+        # Check item limit first; it needs no scan over the codes
+        if len(current_codes) + new_count > 500:
             return BulkOperationResponseSchema(
                 successful=0,
-                failed=len(items),
-                errors=[{"codes": duplicates, "error": "Duplicate codes found"}]
+                failed=new_count,
+                errors=[{"error": f"Adding {new_count} items would exceed 500 item limit"}]
             )
 
-        # Check item limit
-        if len(current_items) + len(items) > 500:
+        # Check for duplicate codes within the request
+        new_codes = {item.code for item in items}
+        if len(new_codes) != new_count:
+            code_counts = Counter(item.code for item in items)
             return BulkOperationResponseSchema(
                 successful=0,
-                failed=len(items),
-                errors=[{"error": f"Adding {len(items)} items would exceed 500 item limit"}]
+                failed=new_count,
+                errors=[{
+                    "codes": sorted(code for code, count in code_counts.items() if count > 1),
+                    "error": "Duplicate codes within request"
+                }]
+            )
+
+        # Check for duplicate codes against the value set
+        duplicates = new_codes.intersection(current_codes)
+        if duplicates:
+            return BulkOperationResponseSchema(
+                successful=0,
+                failed=new_count,
+                errors=[{"codes": sorted(duplicates), "error": "Duplicate codes found"}]
             )
 
         # Perform bulk add
         operations = [{
             "key": key,
-            "items": [item.model_dump() for item in items],
+            "items": _ITEM_LIST_ADAPTER.dump_python(items, mode="python"),
             "update_fields": {
-                "updatedAt": datetime.utcnow(),
+                "updatedAt": _utcnow(),
                 "updatedBy": updated_by
             }
         }]
 
         result = await self.repository.bulk_add_items(operations)
+        self._invalidate(key)
 
         return BulkOperationResponseSchema(
             successful=result["modified"],
-            failed=len(items) - result["modified"],
+            failed=new_count - result["modified"],
             errors=[],
             processedKeys=[key] if result["modified"] > 0 else []
         )
@@ -856,31 +1325,26 @@ class ValueSetService:
         response = await service.bulk_update_items(updates)
         ```
         """
+        # One timestamp for the whole batch
+        now = _utcnow()
+
         operations = []
         for update in updates.itemUpdates:
-            item_updates = {}
-            if update.updates.code:
-                item_updates["code"] = update.updates.code
-            if update.updates.labels:
-                labels_update = {}
-                if update.updates.labels.en:
-                    labels_update["en"] = update.updates.labels.en
-                if update.updates.labels.hi is not None:
-                    labels_update["hi"] = update.updates.labels.hi
-                if labels_update:
-                    item_updates["labels"] = labels_update
+            item_updates = _item_updates(update.updates)
 
             operations.append({
                 "key": update.valueSetKey,
                 "item_code": update.itemCode,
                 "updates": item_updates,
                 "update_fields": {
-                    "updatedAt": datetime.utcnow(),
+                    "updatedAt": now,
                     "updatedBy": update.updatedBy
                 }
             })
 
         result = await self.repository.bulk_update_items(operations)
+        for op in operations:
+            self._invalidate(op["key"])
 
         return BulkOperationResponseSchema(
             successful=result["successful"],
@@ -910,6 +1374,10 @@ class ValueSetService:
         • Checks new code doesn't conflict with other items
         • Replaces item code while preserving or updating labels
         • Uses existing labels if new labels not provided
+        • Both checks are part of the single update query; the items are only
+          re-read to explain a failed replacement
+        • A failed replacement the re-read codes cannot explain (the items changed
+          in between) is retried once, then reported as a concurrent modification
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Maintains item position within the value set
 
@@ -928,7 +1396,8 @@ class ValueSetService:
                 None if value set not found. Contains all items with replacement applied.
 
         Raises:
-            ValueError: If original item not found or new code conflicts with existing item
+            ValueError: If original item not found, new code conflicts with existing item,
+                or the item was modified concurrently on both attempts
 
         Example:
         ```python
@@ -944,48 +1413,43 @@ class ValueSetService:
         updated_vs = await service.replace_value_in_item("test-key", replace_request)
         ```
         """
-        # Get current items to validate
-        current_items = await self.repository.get_items_by_key(key)
-        if current_items is None:
-            return None
-
-        # Find old item
-        old_item = None
-        for item in current_items:
-            if item["code"] == replace_request.oldCode:
-                old_item = item
-                break
-
-        if not old_item:
-            raise ValueError(f"Item with code '{replace_request.oldCode}' not found")
-
-        # Check new code doesn't conflict
-        if replace_request.newCode != replace_request.oldCode:
-            existing_codes = [item["code"] for item in current_items if item["code"] != replace_request.oldCode]
-            if replace_request.newCode in existing_codes:
-                raise ValueError(f"Item with code '{replace_request.newCode}' already exists")
-
-        # Prepare new item
-        new_item = {
-            "code": replace_request.newCode,
-            "labels": replace_request.newLabels.model_dump() if replace_request.newLabels else old_item["labels"]
-        }
+        # Keep the existing labels unless new ones were supplied
+        item_updates = {"code": replace_request.newCode}
+        if replace_request.newLabels:
+            item_updates["labels"] = replace_request.newLabels.model_dump()
 
         update_fields = {
-            "updatedAt": datetime.utcnow(),
+            "updatedAt": _utcnow(),
             "updatedBy": replace_request.updatedBy
         }
 
-        result = await self.repository.replace_item_value(
-            key,
-            replace_request.oldCode,
-            new_item,
-            update_fields
-        )
+        old_code, new_code = replace_request.oldCode, replace_request.newCode
+        for _ in range(2):
+            # Existence and code conflicts are enforced by the update filter itself
+            result = await self.repository.update_item(
+                key,
+                old_code,
+                item_updates,
+                update_fields
+            )
 
-        if result:
-            return ValueSetResponseSchema(**result)
-        return None
+            if result:
+                self._invalidate(key)
+                return _value_set_from_doc(result)
+
+            # Work out why nothing matched only on the failure path
+            current_codes = await self.repository.get_item_codes(key)
+            if current_codes is None:
+                return None
+
+            current_codes = set(current_codes)
+            if old_code not in current_codes:
+                raise ValueError(f"Item with code '{old_code}' not found")
+            if new_code != old_code and new_code in current_codes:
+                raise ValueError(f"Item with code '{new_code}' already exists")
+            # Neither explains the miss: the items changed in between, so try once more
+
+        raise ValueError(f"Item with code '{old_code}' was modified concurrently; please retry")
 
     async def bulk_import_value_sets(
         self,
@@ -1003,7 +1467,9 @@ class ValueSetService:
 
         Business Logic:
         • Validates all value sets before creating any (fail-fast approach)
+        • Rejects the whole request without a database query if a key repeats within it
         • Checks for duplicate keys across existing and new value sets
+          (existing keys are fetched with one $in query, not one query per set)
         • Validates item uniqueness within each value set
         • Creates audit fields for each value set
         • Performs atomic bulk creation for validated value sets
@@ -1043,13 +1509,44 @@ class ValueSetService:
         response = await service.bulk_import_value_sets(import_data)
         ```
         """
-        # Validate all value sets first
+        keys = [vs.key for vs in import_data.valueSets]
+
+        # Reject intra-batch duplicate keys before touching the database
+        if len(set(keys)) != len(keys):
+            counts = Counter(keys)
+            errors = [
+                {"index": idx, "key": k, "error": f"Key '{k}' appears {counts[k]} times in request"}
+                for idx, k in enumerate(keys)
+                if counts[k] > 1
+            ]
+            return BulkOperationResponseSchema(
+                successful=0,
+                failed=len(keys),
+                errors=errors,
+                processedKeys=[]
+            )
+
+        # Validate all value sets first, remembering each document's request position
         documents = []
+        document_indexes = []
         errors = []
 
-        for idx, vs in enumerate(import_data.valueSets):
-            # Check if key exists
-            if await self.repository.check_key_exists(vs.key):
+        # Fetch every already-taken key in a single round-trip
+        existing_keys = set(await self.repository.find_keys_in(keys))
+
+        # Serialize every value set's items in one pydantic-core call
+        dumped = _VALUE_SET_LIST_ADAPTER.dump_python(
+            import_data.valueSets,
+            mode="python",
+            include={"__all__": {"items"}}
+        )
+
+        # One timestamp for the whole batch
+        now = _utcnow()
+
+        for idx, (vs, vs_dump) in enumerate(zip(import_data.valueSets, dumped)):
+            # Check if key exists (in the database or earlier in this batch)
+            if vs.key in existing_keys:
                 errors.append({
                     "index": idx,
                     "key": vs.key,
@@ -1057,24 +1554,27 @@ class ValueSetService:
                 })
                 continue
 
-            # Validate items
-            item_codes = [item.code for item in vs.items]
-            if len(item_codes) != len(set(item_codes)):
+            # Validate items, naming any codes that clash
+            code_counts = Counter(item.code for item in vs.items)
+            duplicate_codes = [code for code, count in code_counts.items() if count > 1]
+            if duplicate_codes:
                 errors.append({
                     "index": idx,
                     "key": vs.key,
-                    "error": "Duplicate item codes"
+                    "error": f"Duplicate item codes: {', '.join(duplicate_codes)}"
                 })
                 continue
 
             # Prepare document
+            existing_keys.add(vs.key)
+            document_indexes.append(idx)
             documents.append({
                 "key": vs.key,
-                "status": vs.status.value,
+                "status": _STATUS_VALUE[vs.status],
                 "module": vs.module,
                 "description": vs.description,
-                "items": [item.model_dump() for item in vs.items],
-                "createdAt": vs.createdAt or datetime.utcnow(),
+                "items": vs_dump["items"],
+                "createdAt": vs.createdAt or now,
                 "createdBy": vs.createdBy,
                 "updatedAt": None,
                 "updatedBy": None
@@ -1082,11 +1582,14 @@ class ValueSetService:
 
         if documents:
             result = await self.repository.bulk_create(documents)
+            for doc in documents:
+                self._invalidate(doc["key"])
+            write_errors = _remap_error_indexes(result.get("errors", []), document_indexes)
             return BulkOperationResponseSchema(
                 successful=result["successful"],
                 failed=result["failed"] + len(errors),
-                errors=errors + result.get("errors", []),
-                processedKeys=[doc["key"] for doc in documents[:result["successful"]]]
+                errors=sorted(errors + write_errors, key=itemgetter("index")),
+                processedKeys=result["inserted_keys"]
             )
 
         return BulkOperationResponseSchema(
@@ -1149,15 +1652,18 @@ class ValueSetService:
         response = await service.bulk_update_value_sets(update_data)
         ```
         """
+        # One timestamp for the whole batch
+        now = _utcnow()
+
         operations = []
         for update in update_data.updates:
             update_fields = {
-                "updatedAt": datetime.utcnow(),
+                "updatedAt": now,
                 "updatedBy": update_data.updatedBy
             }
 
             if update.status:
-                update_fields["status"] = update.status.value
+                update_fields["status"] = _STATUS_VALUE[update.status]
             if update.module:
                 update_fields["module"] = update.module
             if update.description is not None:
@@ -1169,17 +1675,20 @@ class ValueSetService:
             })
 
         result = await self.repository.bulk_update(operations)
+        for op in operations:
+            self._invalidate(op["key"])
 
         return BulkOperationResponseSchema(
-            successful=result["modified"],
-            failed=len(operations) - result["modified"],
-            errors=[],
-            processedKeys=[op["key"] for op in operations[:result["modified"]]]
+            successful=result["matched"],
+            failed=len(operations) - result["matched"],
+            errors=[{"key": key, "error": "Value set not found"} for key in result["missing_keys"]],
+            processedKeys=result["modified_keys"]
         )
 
     async def validate_value_set(
         self,
-        validation_request: ValidateValueSetRequestSchema
+        validation_request: ValidateValueSetRequestSchema,
+        known_existing: Optional[Set[str]] = None
     ) -> ValidationResultSchema:
         """
         Validate a value set configuration against business rules and constraints.
@@ -1196,7 +1705,8 @@ class ValueSetService:
         • Checks item count limits (1-500 items)
         • Ensures required English labels are present
         • Validates status values against allowed enum
-        • Checks for existing key conflicts (warning only)
+        • Checks for existing key conflicts (warning only), looked up concurrently
+          with a single pass over the items, or read from known_existing if given
         • Generates performance warnings for large value sets (>100 items)
 
         Args:
@@ -1206,6 +1716,8 @@ class ValueSetService:
                 - items (List[ItemCreateSchema]): Items to validate
                 - All fields that would be used in actual creation
                 Complete value set structure for comprehensive validation.
+            known_existing (Optional[Set[str]]): Keys already known to exist, e.g. from
+                one find_keys_in call for a batch. When given, no database lookup is made.
 
         Returns:
             ValidationResultSchema: Validation results containing:
@@ -1232,33 +1744,51 @@ class ValueSetService:
             print(f"Validation failed: {result.errors}")
         ```
         """
+        # Look up the key while the items are checked, unless the caller already knows
+        if known_existing is None:
+            key_exists_task = asyncio.create_task(self.repository.check_key_exists(validation_request.key))
+            await asyncio.sleep(0)
+
         errors = []
         warnings = []
 
-        # Check unique item codes
-        item_codes = [item.code for item in validation_request.items]
-        if len(item_codes) != len(set(item_codes)):
-            errors.append("Item codes must be unique within the value set")
+        # Count codes and collect missing English labels in a single pass
+        code_counts = Counter()
+        label_errors = []
+        for item in validation_request.items:
+            code_counts[item.code] += 1
+            if not (item.labels and item.labels.en):
+                label_errors.append(f"English label required for item '{item.code}'")
+
+        # Check unique item codes, naming the ones that clash
+        duplicate_codes = [code for code, count in code_counts.items() if count > 1]
+        if duplicate_codes:
+            errors.append(
+                f"Item codes must be unique within the value set: {', '.join(duplicate_codes)}"
+            )
 
         # Check item count
-        if not (1 <= len(validation_request.items) <= 500):
-            errors.append(f"Number of items must be between 1 and 500 (got {len(validation_request.items)})")
+        item_count = len(validation_request.items)
+        if not (1 <= item_count <= 500):
+            errors.append(f"Number of items must be between 1 and 500 (got {item_count})")
 
         # Check required English labels
-        for item in validation_request.items:
-            if not item.labels.en:
-                errors.append(f"English label required for item '{item.code}'")
+        errors.extend(label_errors)
 
         # Check status value
-        if validation_request.status.value not in ["active", "archived"]:
+        if validation_request.status.value not in _ALLOWED_STATUSES:
             errors.append(f"Invalid status: {validation_request.status.value}")
 
         # Warnings
-        if len(validation_request.items) > 100:
-            warnings.append(f"Large number of items ({len(validation_request.items)}) may impact performance")
+        if item_count > 100:
+            warnings.append(f"Large number of items ({item_count}) may impact performance")
 
         # Check if key already exists (warning only)
-        if await self.repository.check_key_exists(validation_request.key):
+        if known_existing is not None:
+            key_exists = validation_request.key in known_existing
+        else:
+            key_exists = await key_exists_task
+        if key_exists:
             warnings.append(f"Value set with key '{validation_request.key}' already exists")
 
         return ValidationResultSchema(
@@ -1268,6 +1798,44 @@ class ValueSetService:
             warnings=warnings
         )
 
+    async def validate_value_sets_bulk(
+        self,
+        validation_requests: List[ValidateValueSetRequestSchema]
+    ) -> List[ValidationResultSchema]:
+        """
+        Validate several value set configurations with a single key lookup.
+
+        LLM Instructions:
+        • Use this method for validate-then-save flows that check many value sets
+        • Results come back in the same order as the requests
+        • Does not modify data - only validates configuration
+
+        Business Logic:
+        • Looks up every key at once with a single $in query
+        • Applies the same rules as validate_value_set to each request
+        • Existing keys are reported as warnings, as for a single validation
+
+        Args:
+            validation_requests (List[ValidateValueSetRequestSchema]): Value sets to validate.
+
+        Returns:
+            List[ValidationResultSchema]: One validation result per request.
+
+        Example:
+        ```python
+        results = await service.validate_value_sets_bulk([request_a, request_b])
+        invalid = [result.key for result in results if not result.isValid]
+        ```
+        """
+        # Check which keys already exist in one round-trip
+        keys = list(dict.fromkeys(request.key for request in validation_requests))
+        existing_keys = set(await self.repository.find_keys_in(keys)) if keys else set()
+
+        return [
+            await self.validate_value_set(request, existing_keys)
+            for request in validation_requests
+        ]
+
     async def archive_value_set(
         self,
         archive_request: ArchiveRestoreRequestSchema
@@ -1283,8 +1851,8 @@ class ValueSetService:
         • Use restore_value_set to reverse this operation
 
         Business Logic:
-        • Validates value set exists before archiving
-        • Prevents archiving already archived value sets
+        • Archives with one conditional update that skips already archived value sets
+        • Reads the value set only on failure, to report not-found vs already archived
         • Changes status from any state to ARCHIVED
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Preserves all value set data and items
@@ -1320,51 +1888,45 @@ class ValueSetService:
             print(f"Archived: {response.message}")
         ```
         """
-        # Get current value set
-        current = await self.repository.find_by_key(archive_request.key)
-        if not current:
-            return ArchiveRestoreResponseSchema(
-                success=False,
-                key=archive_request.key,
-                previousStatus="unknown",
-                currentStatus="unknown",
-                message=f"Value set with key '{archive_request.key}' not found"
-            )
-
-        previous_status = current["status"]
-
-        if previous_status == "archived":
-            return ArchiveRestoreResponseSchema(
-                success=False,
-                key=archive_request.key,
-                previousStatus=previous_status,
-                currentStatus=previous_status,
-                message="Value set is already archived"
-            )
-
-        # Archive the value set
         update_fields = {
-            "updatedAt": datetime.utcnow(),
+            "updatedAt": _utcnow(),
             "updatedBy": archive_request.updatedBy
         }
 
-        result = await self.repository.archive(archive_request.key, update_fields)
-
-        if result:
+        # Conditional update: the status check and the write are one round-trip
+        previous = await self.repository.archive_if_active(archive_request.key, update_fields)
+        if previous:
+            self._invalidate(archive_request.key)
             return ArchiveRestoreResponseSchema(
                 success=True,
                 key=archive_request.key,
-                previousStatus=previous_status,
+                previousStatus=previous["status"],
                 currentStatus="archived",
                 message=f"Value set archived successfully{f': {archive_request.reason}' if archive_request.reason else ''}"
             )
 
+        # Nothing changed; read once to tell a missing key from a no-op
+        current = await self.repository.find_by_key(archive_request.key)
+        if not current:
+            return ArchiveRestoreResponseSchema(
+                success=False,
+                key=archive_request.key,
+                previousStatus="unknown",
+                currentStatus="unknown",
+                message=f"Value set with key '{archive_request.key}' not found"
+            )
+
+        if current["status"] == "archived":
+            message = "Value set is already archived"
+        else:
+            message = "Failed to archive value set"
+
         return ArchiveRestoreResponseSchema(
             success=False,
             key=archive_request.key,
-            previousStatus=previous_status,
-            currentStatus=previous_status,
-            message="Failed to archive value set"
+            previousStatus=current["status"],
+            currentStatus=current["status"],
+            message=message
         )
 
     async def restore_value_set(
@@ -1382,8 +1944,8 @@ class ValueSetService:
         • Use archive_value_set to reverse this operation
 
         Business Logic:
-        • Validates value set exists before restoring
-        • Prevents restoring already active value sets
+        • Restores with one conditional update that skips already active value sets
+        • Reads the value set only on failure, to report not-found vs already active
         • Changes status from ARCHIVED to ACTIVE
         • Updates audit fields: updatedAt (current time), updatedBy (from request)
         • Preserves all value set data and items
@@ -1419,51 +1981,45 @@ class ValueSetService:
             print(f"Restored: {response.message}")
         ```
         """
-        # Get current value set
-        current = await self.repository.find_by_key(restore_request.key)
-        if not current:
-            return ArchiveRestoreResponseSchema(
-                success=False,
-                key=restore_request.key,
-                previousStatus="unknown",
-                currentStatus="unknown",
-                message=f"Value set with key '{restore_request.key}' not found"
-            )
-
-        previous_status = current["status"]
-
-        if previous_status == "active":
-            return ArchiveRestoreResponseSchema(
-                success=False,
-                key=restore_request.key,
-                previousStatus=previous_status,
-                currentStatus=previous_status,
-                message="Value set is already active"
-            )
-
-        # Restore the value set
         update_fields = {
-            "updatedAt": datetime.utcnow(),
+            "updatedAt": _utcnow(),
             "updatedBy": restore_request.updatedBy
         }
 
-        result = await self.repository.restore(restore_request.key, update_fields)
-
-        if result:
+        # Conditional update: the status check and the write are one round-trip
+        previous = await self.repository.restore_if_archived(restore_request.key, update_fields)
+        if previous:
+            self._invalidate(restore_request.key)
             return ArchiveRestoreResponseSchema(
                 success=True,
                 key=restore_request.key,
-                previousStatus=previous_status,
+                previousStatus=previous["status"],
                 currentStatus="active",
                 message=f"Value set restored successfully{f': {restore_request.reason}' if restore_request.reason else ''}"
             )
 
+        # Nothing changed; read once to tell a missing key from a no-op
+        current = await self.repository.find_by_key(restore_request.key)
+        if not current:
+            return ArchiveRestoreResponseSchema(
+                success=False,
+                key=restore_request.key,
+                previousStatus="unknown",
+                currentStatus="unknown",
+                message=f"Value set with key '{restore_request.key}' not found"
+            )
+
+        if current["status"] == "active":
+            message = "Value set is already active"
+        else:
+            message = "Failed to restore value set"
+
         return ArchiveRestoreResponseSchema(
             success=False,
             key=restore_request.key,
-            previousStatus=previous_status,
-            currentStatus=previous_status,
-            message="Failed to restore value set"
+            previousStatus=current["status"],
+            currentStatus=current["status"],
+            message=message
         )
 
     async def get_value_set_statistics(self) -> Dict[str, Any]:
@@ -1478,11 +2034,15 @@ class ValueSetService:
         • No parameters required - analyzes entire system
 
         Business Logic:
-        • Retrieves base statistics from repository layer
-        • Calculates additional derived metrics (capacity usage, percentages)
-        • Provides total capacity based on 500-item limit per value set
-        • Computes capacity utilization percentages
+        • Retrieves statistics from the repository layer, whose aggregation
+          also derives total capacity (500 items per set) and percent used
         • Aggregates data across all value sets in the system
+        • Caches the result for up to 30 seconds, tagged with a write version;
+          any value set write in this process, even one racing the query,
+          invalidates it. Writes made by other workers are only picked up when
+          the entry expires, so their statistics can be up to 30 seconds stale
+        • Each caller gets its own deep copy, so mutating the result never
+          touches the cache
 
         Args:
             None: No parameters required, analyzes entire system
@@ -1507,17 +2067,16 @@ class ValueSetService:
         print(f"Active sets: {stats['status_distribution'].get('active', 0)}")
         ```
         """
+        # Serve from the cache unless a write has happened since it was read
+        cache_key = id(self.repository.db)
+        cached = _stats_cache.get(cache_key)
+        if cached is not None and cached[0] == _write_version:
+            return copy.deepcopy(cached[1])
+
+        # A write that lands while the query runs leaves this entry outdated
+        version = _write_version
         stats = await self.repository.get_statistics()
-
-        # Add calculated statistics
-        if stats["items_statistics"]:
-            items_stats = stats["items_statistics"]
-            stats["items_statistics"]["total_capacity"] = stats["total_value_sets"] * 500
-            stats["items_statistics"]["capacity_used_percent"] = (
-                (items_stats.get("total_items", 0) / (stats["total_value_sets"] * 500 * 100))
-                if stats["total_value_sets"] > 0 else 0
-            )
-
+        _stats_cache[cache_key] = (version, copy.deepcopy(stats))
         return stats
 
     async def export_value_set(self, key: str, format: str = "json") -> Dict[str, Any]:
@@ -1532,7 +2091,9 @@ class ValueSetService:
         • Use for data migration, reporting, and integration scenarios
 
         Business Logic:
-        • Retrieves complete value set data from repository
+        • Rejects unsupported formats before touching the database
+        • JSON fetches the complete document; CSV fetches a projection of
+          codes, en/hi labels and metadata only
         • Formats data according to specified export format
         • JSON format: Returns complete structured data
         • CSV format: Creates tabular representation with metadata
@@ -1568,43 +2129,83 @@ class ValueSetService:
         metadata = csv_data["metadata"]
         ```
         """
-        # Get value set
+        handler = self._EXPORT_HANDLERS.get(format)
+        if handler is None:
+            raise ValueError(f"Unsupported export format: {format}")
+
+        return await handler(self, key)
+
+    async def _export_json(self, key: str) -> Dict[str, Any]:
+        """JSON export: the complete value set document."""
         value_set = await self.repository.export_value_set(key)
         if not value_set:
             raise ValueError(f"Value set with key '{key}' not found")
+        return value_set
 
-        if format == "json":
-            return value_set
+    async def _export_csv(self, key: str) -> Dict[str, Any]:
+        """CSV export: the CSV text plus metadata, in one envelope."""
+        # Only codes, labels and the metadata fields cross the wire
+        value_set = await self.repository.export_value_set_items(key)
+        if not value_set:
+            raise ValueError(f"Value set with key '{key}' not found")
 
-        elif format == "csv":
-            # Convert to CSV format
-            output = StringIO()
-            writer = csv.writer(output)
-
-            # Write header
-            writer.writerow(["Code", "English Label", "Hindi Label"])
-
-            # Write items
-            for item in value_set.get("items", []):
-                writer.writerow([
-                    item["code"],
-                    item["labels"].get("en", ""),
-                    item["labels"].get("hi", "")
-                ])
-
-            return {
-                "format": "csv",
-                "content": output.getvalue(),
-                "metadata": {
-                    "key": value_set["key"],
-                    "module": value_set["module"],
-                    "status": value_set["status"],
-                    "itemCount": len(value_set.get("items", []))
-                }
+        items = value_set.get("items") or ()
+
+        # Convert to CSV format with the same generator the streaming export uses
+        content = "".join([chunk async for chunk in _iter_csv(items)])
+
+        return {
+            "format": "csv",
+            "content": content,
+            "metadata": {
+                "key": value_set["key"],
+                "module": value_set["module"],
+                "status": value_set["status"],
+                "itemCount": len(items)
             }
+        }
 
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+    # Export formats, looked up by export_value_set
+    _EXPORT_HANDLERS = {"json": _export_json, "csv": _export_csv}
+
+    async def export_value_set_csv_stream(self, key: str) -> AsyncIterator[str]:
+        """
+        Open a value set's items as a stream of CSV text chunks.
+
+        LLM Instructions:
+        • Use this method to serve CSV downloads without building the whole file in memory
+        • Await it to get the stream; a missing key raises before any chunk is produced
+        • Use export_value_set with format="csv" when a single string is needed
+
+        Business Logic:
+        • Fetches only codes and en/hi labels once, then formats rows lazily as the stream is consumed
+        • First chunk starts with the header row: Code, English Label, Hindi Label
+        • Each chunk holds up to 100 rows, joined from directly formatted row strings
+        • Output is identical to the "content" of export_value_set(key, "csv")
+
+        Args:
+            key (str): Unique identifier of the value set to export.
+                Must match an existing value set exactly.
+
+        Returns:
+            AsyncIterator[str]: CSV text chunks, in item order.
+
+        Raises:
+            ValueError: If value set not found
+
+        Example:
+        ```python
+        from fastapi.responses import StreamingResponse
+
+        rows = await service.export_value_set_csv_stream("country-codes")
+        return StreamingResponse(rows, media_type="text/csv")
+        ```
+        """
+        value_set = await self.repository.export_value_set_items(key)
+        if not value_set:
+            raise ValueError(f"Value set with key '{key}' not found")
+
+        return _iter_csv(value_set.get("items") or ())
 
     async def import_value_set(
         self,
@@ -1619,14 +2220,16 @@ class ValueSetService:
         • Use this method to import value sets from external systems or backups
         • Ensure import_data structure matches the specified format requirements
         • Handle ValueError for existing keys or format issues
-        • JSON format is fully supported, CSV format is not yet implemented
+        • JSON takes a value set dict; CSV takes the envelope export_value_set(format="csv") returns
         • Use for data migration, system integration, and restoration scenarios
 
         Business Logic:
-        • Validates key uniqueness before importing
+        • Validates key uniqueness before importing; the lookup runs while
+          the payload is parsed and stamped
         • Sets audit fields for import tracking
-        • JSON format: Direct structure validation and import
-        • CSV format: Not yet implemented (raises NotImplementedError)
+        • JSON format: Validated through ValueSetCreateSchema, like creates
+        • CSV format: Parses rows lazily from "content", takes key/module/status/description
+          from "metadata", and validates everything with ValueSetCreateSchema
         • Creates complete value set with all items and metadata
         • Preserves original structure while adding audit fields
 
@@ -1634,9 +2237,10 @@ class ValueSetService:
             import_data (dict): External data to import with structure dependent on format.
                 For JSON format: Complete value set dictionary with key, status, module,
                 description, items array. Must have valid structure.
+                For CSV format: {"content": "Code,English Label,Hindi Label\\r\\n...",
+                "metadata": {"key": ..., "module": ..., "status": ..., "description": ...}}
             format (str): Import format specification (default: "json").
-                Supported values: "json" (structured data)
-                Unsupported: "csv" (raises NotImplementedError)
+                Supported values: "json" (structured data), "csv" (export envelope)
             created_by (str): Username/ID of user performing the import (default: "system").
                 Used for audit trail in createdBy field.
 
@@ -1645,8 +2249,7 @@ class ValueSetService:
                 Contains all imported data plus database-generated fields.
 
         Raises:
-            ValueError: If key already exists or unsupported format specified
-            NotImplementedError: If CSV format is requested
+            ValueError: If key already exists, CSV content is invalid, or unsupported format specified
 
         Example:
         ```python
@@ -1661,25 +2264,142 @@ class ValueSetService:
         value_set = await service.import_value_set(import_data, "json", "admin123")
         ```
         """
-        if format == "json":
-            # Validate the import data
-            if await self.repository.check_key_exists(import_data["key"]):
-                raise ValueError(f"Value set with key '{import_data['key']}' already exists")
-
-            # Set audit fields
-            import_data["createdAt"] = datetime.utcnow()
-            import_data["createdBy"] = created_by
-            import_data["updatedAt"] = None
-            import_data["updatedBy"] = None
-
-            # Import to database
-            result = await self.repository.import_value_set(import_data)
-            return ValueSetResponseSchema(**result)
-
-        elif format == "csv":
-            # Parse CSV format
-            # This would require additional parsing logic
-            raise NotImplementedError("CSV import not yet implemented")
+        import_format = _IMPORT_FORMATS.get(format)
+        if import_format is None:
+            raise ValueError(f"Unsupported import format: {format}")
 
-        else:
-            raise ValueError(f"Unsupported import format: {format}")
\ No newline at end of file
+        get_key, parse = import_format
+        key = get_key(import_data)
+
+        # Start the key lookup first; yielding once hands the query to the
+        # driver so its round-trip overlaps parsing and audit stamping below
+        exists_task = asyncio.create_task(self.repository.check_key_exists(key))
+        await asyncio.sleep(0)
+
+        try:
+            document = _prepare_import_document(import_data, parse, created_by, _utcnow())
+        except ValueError:
+            exists_task.cancel()
+            raise
+
+        # Check if key already exists
+        if await exists_task:
+            raise ValueError(f"Value set with key '{key}' already exists")
+
+        # Import to database; the unique key index catches an import that raced the check above
+        try:
+            result = await self.repository.import_value_set(document)
+        except DuplicateKeyError:
+            raise ValueError(f"Value set with key '{key}' already exists")
+        self._invalidate(key)
+
+        # The document was validated before the write, so skip re-validation
+        return _value_set_from_doc(result)
+
+    async def import_value_sets_bulk(
+        self,
+        import_data: List[dict],
+        created_by: str = "system",
+        skip_duplicates: bool = False
+    ) -> BulkOperationResponseSchema:
+        """
+        Import many exported value set documents with two database round-trips.
+
+        LLM Instructions:
+        • Use this method for migrations instead of calling import_value_set in a loop
+        • Pass skip_duplicates=True to import what is new and report the rest
+        • Handle ValueError for key collisions when skip_duplicates is False
+        • Use bulk_import_value_sets when the input is already schema-validated
+
+        Business Logic:
+        • Accepts at most 100 value sets per request
+        • Validates each document exactly like import_value_set; invalid ones are
+          reported by index and not written
+        • Rejects the request if a key repeats within it, before any query
+        • Looks up every key at once with a single $in query
+        • Collisions raise ValueError listing them, or are skipped and reported
+        • Stamps the same audit fields import_value_set sets
+        • Inserts all remaining documents in one unordered insert_many
+
+        Args:
+            import_data (List[dict]): Value set documents as produced by the JSON export,
+                each with key, status, module, description and items.
+            created_by (str): Username/ID of user performing the import (default: "system").
+                Used for audit trail in createdBy field.
+            skip_duplicates (bool): Skip documents whose key already exists instead of
+                failing the whole request (default: False).
+
+        Returns:
+            BulkOperationResponseSchema: Import results containing:
+                - successful (int): Number of value sets created
+                - failed (int): Number that were invalid, skipped as duplicates or
+                  rejected by the database
+                - errors (List[Dict]): Index, key and reason for each failure
+                - processedKeys (List[str]): Keys of the value sets created
+
+        Raises:
+            ValueError: If more than 100 value sets are given, a key repeats in the
+                request, or a key already exists and skip_duplicates is False
+
+        Example:
+        ```python
+        exported = [await service.export_value_set(key) for key in ("a", "b")]
+        result = await service.import_value_sets_bulk(exported, "migration", skip_duplicates=True)
+        print(f"Imported {result.successful}, skipped {result.failed}")
+        ```
+        """
+        if len(import_data) > 100:
+            raise ValueError("Cannot import more than 100 value sets at once")
+
+        # Validate every document the same way a single import is validated
+        errors = []
+        prepared = []
+        now = _utcnow()
+        for idx, vs in enumerate(import_data):
+            try:
+                prepared.append((idx, _prepare_import_document(vs, _value_set_from_json, created_by, now)))
+            except ValueError as e:
+                errors.append({"index": idx, "key": vs.get("key"), "error": str(e)})
+
+        keys = [document["key"] for _, document in prepared]
+
+        # Check for keys repeated within the request
+        key_counts = Counter(keys)
+        repeated = [key for key, count in key_counts.items() if count > 1]
+        if repeated:
+            raise ValueError(f"Duplicate keys in import: {', '.join(repeated)}")
+
+        # Check for keys that already exist in one round-trip
+        existing_keys = set(await self.repository.find_keys_in(keys)) if keys else set()
+        if existing_keys and not skip_duplicates:
+            raise ValueError(f"Value sets already exist: {', '.join(sorted(existing_keys))}")
+
+        documents = []
+        document_indexes = []
+        for idx, document in prepared:
+            if document["key"] in existing_keys:
+                errors.append({"index": idx, "key": document["key"], "error": f"Key '{document['key']}' already exists"})
+            else:
+                documents.append(document)
+                document_indexes.append(idx)
+        errors.sort(key=itemgetter("index"))
+
+        if not documents:
+            return BulkOperationResponseSchema(
+                successful=0,
+                failed=len(errors),
+                errors=errors,
+                processedKeys=[]
+            )
+
+        result = await self.repository.bulk_create(documents)
+        for doc in documents:
+            self._invalidate(doc["key"])
+
+        write_errors = _remap_error_indexes(result.get("errors", []), document_indexes)
+        return BulkOperationResponseSchema(
+            successful=result["successful"],
+            failed=result["failed"] + len(errors),
+            errors=sorted(errors + write_errors, key=itemgetter("index")),
+            processedKeys=result["inserted_keys"]
+        )
\ No newline at end of file
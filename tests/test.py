@@ -7,6 +7,8 @@ File: tests/test.py
 import asyncio
 import sys
 import os
+import time
+import base64
 from datetime import datetime
 from typing import Dict, Any, List
 import json
@@ -87,6 +89,8 @@ class ValueSetTester:
         self.repository = None
         self.db = None
         self.created_keys = []
+        # One suffix for every key this run creates, so keys never collide within a run
+        self.run_id = time.time_ns()
 
     async def setup(self):
         """Initialize database connection and services"""
@@ -133,7 +137,7 @@ class ValueSetTester:
         """Test basic value set creation with minimal data"""
         test_name = "Create Basic Value Set"
         try:
-            key = f"TEST_BASIC_{datetime.utcnow().timestamp()}"
+            key = f"TEST_BASIC_{self.run_id}"
             self.created_keys.append(key)
 
             items = [
@@ -174,7 +178,7 @@ class ValueSetTester:
         """Test creating value set with maximum allowed items (500)"""
         test_name = "Create Value Set with Max Items (500)"
         try:
-            key = f"TEST_MAX_ITEMS_{datetime.utcnow().timestamp()}"
+            key = f"TEST_MAX_ITEMS_{self.run_id}"
             self.created_keys.append(key)
 
             items = [
@@ -211,7 +215,7 @@ class ValueSetTester:
         """Test that creating duplicate key fails"""
         test_name = "Create Duplicate Key (Should Fail)"
         try:
-            key = f"TEST_DUPLICATE_{datetime.utcnow().timestamp()}"
+            key = f"TEST_DUPLICATE_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="TEST", labels=LabelSchema(en="Test"))]
@@ -242,7 +246,7 @@ class ValueSetTester:
         """Test that duplicate item codes within value set are rejected"""
         test_name = "Create with Duplicate Item Codes (Should Fail)"
         try:
-            key = f"TEST_DUP_ITEMS_{datetime.utcnow().timestamp()}"
+            key = f"TEST_DUP_ITEMS_{self.run_id}"
 
             items = [
                 ItemCreateSchema(code="DUP", labels=LabelSchema(en="First")),
@@ -278,7 +282,7 @@ class ValueSetTester:
         """Test retrieving value set by key"""
         test_name = "Get Value Set by Key"
         try:
-            key = f"TEST_GET_{datetime.utcnow().timestamp()}"
+            key = f"TEST_GET_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="GET001", labels=LabelSchema(en="Get Test"))]
@@ -322,7 +326,7 @@ class ValueSetTester:
         try:
             keys = []
             for i in range(5):
-                key = f"TEST_LIST_{i}_{datetime.utcnow().timestamp()}"
+                key = f"TEST_LIST_{i}_{self.run_id}"
                 keys.append(key)
                 self.created_keys.append(key)
 
@@ -356,13 +360,126 @@ class ValueSetTester:
         except Exception as e:
             self.results.add_fail(test_name, str(e))
 
+    async def test_list_value_sets_cursor_pages(self):
+        """Test walking two pages of value sets with the opaque cursor"""
+        test_name = "List Value Sets with Cursor"
+        try:
+            module = f"Cursor_{self.run_id}"
+            keys = []
+            for i in range(3):
+                key = f"TEST_CURSOR_{i}_{self.run_id}"
+                keys.append(key)
+                self.created_keys.append(key)
+
+                items = [ItemCreateSchema(code=f"P{i}", labels=LabelSchema(en=f"Page {i}"))]
+                create_data = ValueSetCreateSchema(
+                    key=key,
+                    status=StatusEnum.ACTIVE,
+                    module=module,
+                    items=items,
+                    createdBy="test_user"
+                )
+                await self.service.create_value_set(create_data)
+
+            first_page = await self.service.list_value_sets(
+                ListValueSetsQuerySchema(module=module, limit=2)
+            )
+            second_page = await self.service.list_value_sets(
+                ListValueSetsQuerySchema(module=module, limit=2, cursor=first_page.nextCursor)
+            )
+
+            seen = [vs.key for vs in first_page.items] + [vs.key for vs in second_page.items]
+            if (
+                len(first_page.items) == 2 and first_page.hasMore and first_page.nextCursor
+                and len(second_page.items) == 1 and not second_page.hasMore
+                and sorted(seen) == sorted(keys)
+            ):
+                self.results.add_pass(test_name, "Two pages covered every value set exactly once")
+            else:
+                self.results.add_fail(test_name, f"Unexpected pages: {seen}")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
+    async def test_list_value_sets_cursor_without_created_at(self):
+        """Test that the cursor reaches value sets with a missing or null createdAt"""
+        test_name = "List Value Sets with Cursor and No createdAt"
+        try:
+            module = f"CursorNoDate_{self.run_id}"
+            keys = []
+            for i in range(3):
+                key = f"TEST_CURSOR_NO_DATE_{i}_{self.run_id}"
+                keys.append(key)
+                self.created_keys.append(key)
+
+                items = [ItemCreateSchema(code=f"N{i}", labels=LabelSchema(en=f"No date {i}"))]
+                create_data = ValueSetCreateSchema(
+                    key=key,
+                    status=StatusEnum.ACTIVE,
+                    module=module,
+                    items=items,
+                    createdBy="test_user"
+                )
+                await self.service.create_value_set(create_data)
+
+            # Legacy documents: one without createdAt, one with a null createdAt
+            await self.db.value_sets.update_one({"key": keys[1]}, {"$unset": {"createdAt": ""}})
+            await self.db.value_sets.update_one({"key": keys[2]}, {"$set": {"createdAt": None}})
+
+            seen = []
+            cursor = None
+            for _ in range(len(keys) + 1):
+                page = await self.service.list_value_sets(
+                    ListValueSetsQuerySchema(module=module, limit=1, cursor=cursor)
+                )
+                seen.extend(vs.key for vs in page.items)
+                if not page.hasMore:
+                    break
+                cursor = page.nextCursor
+
+            if sorted(seen) == sorted(keys) and len(seen) == len(keys):
+                self.results.add_pass(test_name, "Cursor pages reached every value set exactly once")
+            else:
+                self.results.add_fail(test_name, f"Unexpected pages: {seen}")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
+    async def test_list_value_sets_invalid_cursor(self):
+        """Test that a malformed cursor, or a cursor with skip, is rejected"""
+        test_name = "List Value Sets with Invalid Cursor"
+        try:
+            valid_cursor = base64.urlsafe_b64encode(
+                b'{"c": "2024-01-01T00:00:00", "i": "507f1f77bcf86cd799439011"}'
+            ).decode()
+            bad_queries = [
+                ListValueSetsQuerySchema(cursor="not-a-cursor"),
+                ListValueSetsQuerySchema(cursor=base64.urlsafe_b64encode(b'{"c": "2024-01-01T00:00:00"}').decode()),
+                ListValueSetsQuerySchema(cursor=valid_cursor, skip=10),
+            ]
+
+            rejected = 0
+            for query in bad_queries:
+                try:
+                    await self.service.list_value_sets(query)
+                except ValueError:
+                    rejected += 1
+
+            if rejected == len(bad_queries):
+                self.results.add_pass(test_name, "Malformed cursors and cursor with skip correctly rejected")
+            else:
+                self.results.add_fail(test_name, f"Only {rejected} of {len(bad_queries)} queries rejected")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
     # ==================== UPDATE TESTS ====================
 
     async def test_update_value_set_description(self):
         """Test updating value set description"""
         test_name = "Update Value Set Description"
         try:
-            key = f"TEST_UPDATE_DESC_{datetime.utcnow().timestamp()}"
+            key = f"TEST_UPDATE_DESC_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="UPD", labels=LabelSchema(en="Update Test"))]
@@ -396,7 +513,7 @@ class ValueSetTester:
         """Test updating value set status"""
         test_name = "Update Value Set Status"
         try:
-            key = f"TEST_UPDATE_STATUS_{datetime.utcnow().timestamp()}"
+            key = f"TEST_UPDATE_STATUS_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="STS", labels=LabelSchema(en="Status Test"))]
@@ -431,7 +548,7 @@ class ValueSetTester:
         """Test adding item to existing value set"""
         test_name = "Add Item to Value Set"
         try:
-            key = f"TEST_ADD_ITEM_{datetime.utcnow().timestamp()}"
+            key = f"TEST_ADD_ITEM_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="ORIG", labels=LabelSchema(en="Original"))]
@@ -462,7 +579,7 @@ class ValueSetTester:
         """Test that adding duplicate item code fails"""
         test_name = "Add Duplicate Item Code (Should Fail)"
         try:
-            key = f"TEST_DUP_ADD_{datetime.utcnow().timestamp()}"
+            key = f"TEST_DUP_ADD_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="DUP", labels=LabelSchema(en="Original"))]
@@ -491,11 +608,57 @@ class ValueSetTester:
         except Exception as e:
             self.results.add_fail(test_name, str(e))
 
+    async def test_concurrent_add_items(self):
+        """Test concurrent item adds from several users, one repeating a queued code"""
+        test_name = "Concurrent Add Items"
+        try:
+            key = f"TEST_CONCURRENT_ADD_{self.run_id}"
+            self.created_keys.append(key)
+
+            items = [ItemCreateSchema(code="BASE", labels=LabelSchema(en="Base"))]
+            create_data = ValueSetCreateSchema(
+                key=key,
+                status=StatusEnum.ACTIVE,
+                module="Testing",
+                items=items,
+                createdBy="test_user"
+            )
+
+            await self.service.create_value_set(create_data)
+
+            requests = [
+                AddItemRequestSchema(item=ItemCreateSchema(code="A1", labels=LabelSchema(en="A1")), updatedBy="user_a"),
+                AddItemRequestSchema(item=ItemCreateSchema(code="B1", labels=LabelSchema(en="B1")), updatedBy="user_b"),
+                AddItemRequestSchema(item=ItemCreateSchema(code="A2", labels=LabelSchema(en="A2")), updatedBy="user_a"),
+                AddItemRequestSchema(item=ItemCreateSchema(code="A1", labels=LabelSchema(en="Again")), updatedBy="user_b"),
+            ]
+            results = await asyncio.gather(
+                *(self.service.add_item_to_value_set(key, request) for request in requests),
+                return_exceptions=True
+            )
+
+            value_set = await self.service.get_value_set_by_key(key)
+            codes = sorted(item.code for item in value_set.items)
+            labels = {item.code: item.labels.en for item in value_set.items}
+            if (
+                all(not isinstance(result, Exception) for result in results[:3])
+                and isinstance(results[3], ValueError)
+                and "already exists" in str(results[3])
+                and codes == ["A1", "A2", "B1", "BASE"]
+                and labels["A1"] == "A1"
+            ):
+                self.results.add_pass(test_name, "Three adds applied, the repeated code was rejected")
+            else:
+                self.results.add_fail(test_name, f"Results: {results}, codes: {codes}")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
     async def test_update_item_labels(self):
         """Test updating item labels"""
         test_name = "Update Item Labels"
         try:
-            key = f"TEST_UPDATE_ITEM_{datetime.utcnow().timestamp()}"
+            key = f"TEST_UPDATE_ITEM_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="UPD", labels=LabelSchema(en="Original Label"))]
@@ -533,11 +696,49 @@ class ValueSetTester:
         except Exception as e:
             self.results.add_fail(test_name, str(e))
 
+    async def test_update_item_with_no_changes(self):
+        """Test an item update with nothing to change only touches the audit fields"""
+        test_name = "Update Item With No Changes"
+        try:
+            key = f"TEST_UPDATE_ITEM_EMPTY_{self.run_id}"
+            self.created_keys.append(key)
+
+            items = [ItemCreateSchema(code="SAME", labels=LabelSchema(en="Unchanged Label"))]
+            create_data = ValueSetCreateSchema(
+                key=key,
+                status=StatusEnum.ACTIVE,
+                module="Testing",
+                items=items,
+                createdBy="test_user"
+            )
+
+            await self.service.create_value_set(create_data)
+
+            update_request = UpdateItemRequestSchema(
+                itemCode="SAME",
+                updates=ItemUpdateSchema(),
+                updatedBy="audit_user"
+            )
+
+            result = await self.service.update_item_in_value_set(key, update_request)
+
+            if result:
+                item = next((item for item in result.items if item.code == "SAME"), None)
+                if item and item.labels.en == "Unchanged Label" and result.updatedBy == "audit_user":
+                    self.results.add_pass(test_name, "Only audit fields were updated")
+                else:
+                    self.results.add_fail(test_name, "Item or audit fields not as expected")
+            else:
+                self.results.add_fail(test_name, "Update failed")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
     async def test_replace_item_code(self):
         """Test replacing item code"""
         test_name = "Replace Item Code"
         try:
-            key = f"TEST_REPLACE_{datetime.utcnow().timestamp()}"
+            key = f"TEST_REPLACE_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="OLD", labels=LabelSchema(en="Old Code"))]
@@ -580,7 +781,7 @@ class ValueSetTester:
         """Test searching for items across value sets"""
         test_name = "Search Value Set Items"
         try:
-            key = f"TEST_SEARCH_{datetime.utcnow().timestamp()}"
+            key = f"TEST_SEARCH_{self.run_id}"
             self.created_keys.append(key)
 
             items = [
@@ -620,7 +821,7 @@ class ValueSetTester:
         """Test searching value sets by label text"""
         test_name = "Search by Label"
         try:
-            key = f"TEST_LABEL_SEARCH_{datetime.utcnow().timestamp()}"
+            key = f"TEST_LABEL_SEARCH_{self.run_id}"
             self.created_keys.append(key)
 
             items = [
@@ -656,7 +857,7 @@ class ValueSetTester:
         """Test archiving a value set"""
         test_name = "Archive Value Set"
         try:
-            key = f"TEST_ARCHIVE_{datetime.utcnow().timestamp()}"
+            key = f"TEST_ARCHIVE_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="ARC", labels=LabelSchema(en="Archive Test"))]
@@ -690,7 +891,7 @@ class ValueSetTester:
         """Test restoring an archived value set"""
         test_name = "Restore Value Set"
         try:
-            key = f"TEST_RESTORE_{datetime.utcnow().timestamp()}"
+            key = f"TEST_RESTORE_{self.run_id}"
             self.created_keys.append(key)
 
             items = [ItemCreateSchema(code="RES", labels=LabelSchema(en="Restore Test"))]
@@ -730,7 +931,7 @@ class ValueSetTester:
             keys = []
 
             for i in range(3):
-                key = f"TEST_BULK_{i}_{datetime.utcnow().timestamp()}"
+                key = f"TEST_BULK_{i}_{self.run_id}"
                 keys.append(key)
                 self.created_keys.append(key)
 
@@ -826,6 +1027,142 @@ class ValueSetTester:
             else:
                 self.results.add_fail(test_name, str(e))
 
+    # ==================== IMPORT/EXPORT TESTS ====================
+
+    async def test_csv_download_non_ascii_key(self):
+        """Test the CSV download endpoint with a key the latin-1 header cannot hold"""
+        test_name = "CSV Download with Non-ASCII Key"
+        try:
+            from routers.value_set_router import export_value_set_csv
+
+            key = f'देश "कोड"_{self.run_id}'
+            self.created_keys.append(key)
+
+            items = [ItemCreateSchema(code="IN", labels=LabelSchema(en="India", hi="भारत"))]
+            create_data = ValueSetCreateSchema(
+                key=key,
+                status=StatusEnum.ACTIVE,
+                module="Testing",
+                items=items,
+                createdBy="test_user"
+            )
+
+            await self.service.create_value_set(create_data)
+
+            response = await export_value_set_csv(key, self.service)
+            disposition = response.headers["content-disposition"]
+            body = "".join([chunk async for chunk in response.body_iterator])
+
+            if (
+                disposition.isascii()
+                and "filename*=UTF-8''%E0%A4%A6" in disposition
+                and body.startswith("Code,English Label,Hindi Label")
+                and "IN,India,भारत" in body
+            ):
+                self.results.add_pass(test_name, f"Header: {disposition}")
+            else:
+                self.results.add_fail(test_name, f"Unexpected download: {disposition!r}")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
+    async def test_csv_export_import_round_trip(self):
+        """Test that a CSV export imports back with quoted labels intact"""
+        test_name = "CSV Export/Import Round Trip"
+        try:
+            key = f"TEST_CSV_{self.run_id}"
+            imported_key = f"TEST_CSV_IMPORTED_{self.run_id}"
+            self.created_keys.extend([key, imported_key])
+
+            items = [
+                ItemCreateSchema(code="COMMA", labels=LabelSchema(en="One, two", hi="एक, दो")),
+                ItemCreateSchema(code="QUOTE", labels=LabelSchema(en='Say "hello"')),
+                ItemCreateSchema(code="NEWLINE", labels=LabelSchema(en="Line one\nLine two", hi="पंक्ति")),
+            ]
+            create_data = ValueSetCreateSchema(
+                key=key,
+                status=StatusEnum.ACTIVE,
+                module="Testing",
+                items=items,
+                createdBy="test_user"
+            )
+
+            await self.service.create_value_set(create_data)
+
+            exported = await self.service.export_value_set(key, "csv")
+            exported["metadata"]["key"] = imported_key
+
+            result = await self.service.import_value_set(exported, "csv", "test_user")
+
+            original = [(item.code, item.labels.en, item.labels.hi) for item in items]
+            round_tripped = [(item.code, item.labels.en, item.labels.hi) for item in result.items]
+            if result.key == imported_key and round_tripped == original:
+                self.results.add_pass(test_name, "Labels with commas, quotes and newlines survived")
+            else:
+                self.results.add_fail(test_name, f"Items differ after import: {round_tripped}")
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
+    async def test_import_exported_value_sets_bulk(self):
+        """Test the bulk import endpoint with invalid, existing and repeated keys"""
+        test_name = "Bulk Import Exported Value Sets"
+        try:
+            from fastapi import HTTPException
+            from routers.value_set_router import import_value_sets_bulk
+
+            existing_key = f"TEST_BULK_IMPORT_EXISTING_{self.run_id}"
+            new_keys = [f"TEST_BULK_IMPORT_{i}_{self.run_id}" for i in range(2)]
+            self.created_keys.extend([existing_key, *new_keys])
+
+            create_data = ValueSetCreateSchema(
+                key=existing_key,
+                status=StatusEnum.ACTIVE,
+                module="Testing",
+                items=[ItemCreateSchema(code="A", labels=LabelSchema(en="A"))],
+                createdBy="test_user"
+            )
+            await self.service.create_value_set(create_data)
+            exported = await self.service.export_value_set(existing_key)
+
+            def document(key):
+                return {"key": key, "status": "active", "items": [{"code": "X", "labels": {"en": "X"}}]}
+
+            import_data = [
+                {"items": [{"code": "X", "labels": {"en": "X"}}]},
+                document(new_keys[0]),
+                exported,
+                document(new_keys[1]),
+            ]
+            result = await import_value_sets_bulk(import_data, "test_user", True, self.service)
+
+            # Repeated keys are rejected up front, even with skip_duplicates
+            try:
+                await import_value_sets_bulk(
+                    [document(new_keys[0]), document(new_keys[0])], "test_user", True, self.service
+                )
+                repeated_status = None
+            except HTTPException as e:
+                repeated_status = e.status_code
+
+            error_indexes = [error["index"] for error in result.errors]
+            if (
+                result.successful == 2
+                and result.failed == 2
+                and error_indexes == [0, 2]
+                and sorted(result.processedKeys) == sorted(new_keys)
+                and repeated_status == 400
+            ):
+                self.results.add_pass(test_name, "Invalid and existing entries reported at their request indexes")
+            else:
+                self.results.add_fail(
+                    test_name,
+                    f"successful={result.successful}, errors={result.errors}, repeated status={repeated_status}"
+                )
+
+        except Exception as e:
+            self.results.add_fail(test_name, str(e))
+
     # ==================== STATISTICS TESTS ====================
 
     async def test_get_statistics(self):
@@ -866,6 +1203,9 @@ class ValueSetTester:
             self.test_get_value_set_by_key,
             self.test_get_nonexistent_value_set,
             self.test_list_value_sets,
+            self.test_list_value_sets_cursor_pages,
+            self.test_list_value_sets_cursor_without_created_at,
+            self.test_list_value_sets_invalid_cursor,
 
             # UPDATE
             self.test_update_value_set_description,
@@ -874,7 +1214,9 @@ class ValueSetTester:
             # ITEM MANAGEMENT
             self.test_add_item_to_value_set,
             self.test_add_duplicate_item_code,
+            self.test_concurrent_add_items,
             self.test_update_item_labels,
+            self.test_update_item_with_no_changes,
             self.test_replace_item_code,
 
             # SEARCH
@@ -892,6 +1234,11 @@ class ValueSetTester:
             self.test_validate_valid_value_set,
             self.test_validate_invalid_value_set,
 
+            # IMPORT/EXPORT
+            self.test_csv_download_non_ascii_key,
+            self.test_csv_export_import_round_trip,
+            self.test_import_exported_value_sets_bulk,
+
             # STATISTICS
             self.test_get_statistics,
         ]
@@ -900,7 +1247,6 @@ class ValueSetTester:
             print(f"\n[{i}/{len(test_methods)}] Running: {test_method.__name__}")
             print("-" * 80)
             await test_method()
-            await asyncio.sleep(0.1)
 
         print(f"\nTest End Time: {datetime.utcnow().isoformat()}")
         self.results.print_summary()